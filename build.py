@@ -5,12 +5,12 @@ Cross-platform build system using PyInstaller.
 
 Usage:
     python build.py              # Build for current platform
-    python build.py --clean      # Clean build artifacts
+    python build.py --clean      # Clean build artifacts (forces a cold rebuild)
+    python build.py --full-clean # Build without reusing PyInstaller's cache
     python build.py --onefile    # Build single executable
     python build.py --package    # Build and create distributable archive
 """
 
-import subprocess
 import sys
 import os
 import shutil
@@ -27,6 +27,58 @@ DIST_DIR = ROOT_DIR / 'dist'
 BUILD_DIR = ROOT_DIR / 'build'
 SPEC_FILE = ROOT_DIR / 'onlycode.spec'
 IMAGES_DIR = ROOT_DIR / 'images'
+CACHE_DIR = BUILD_DIR / 'build-cache'
+# Cache key and output type of the build currently in dist/
+BUILD_STAMP = CACHE_DIR / 'last-build'
+PYINSTALLER_CONFIG_DIR = ROOT_DIR / '.pyinstaller-cache'
+
+# Archive settings: level 6 is far cheaper than gzip's default 9 for a
+# negligible size difference; a 1 MiB write buffer cuts syscall count
+ARCHIVE_COMPRESSLEVEL = 6
+ARCHIVE_BUFFER_SIZE = 1 << 20
+
+# Payloads that are already compressed; DEFLATE only burns CPU on these.
+# Everything else stays ZIP_DEFLATED: ZIP_LZMA/ZIP_BZIP2 would shrink .py
+# files further, but the Windows and macOS built-in unzippers reject them.
+STORED_SUFFIXES = frozenset({
+    '.zip', '.whl', '.gz', '.bz2', '.xz', '.pkz',
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.icns',
+})
+
+# Modules PyInstaller cannot discover on its own
+HIDDEN_IMPORTS = [
+    'onlycode',
+    'onlycode.app',
+    'onlycode.app.application',
+    'onlycode.app.screens',
+    'onlycode.app.widgets',
+    'onlycode.editor',
+    'textual',
+    'tree_sitter',
+]
+
+# Packages whose data files, binaries and submodules are bundled wholesale
+# (tree-sitter grammars are appended from TS_PKGS)
+COLLECT_ALL = ['textual', 'tree_sitter']
+
+# Tree-sitter grammar packages bundled for syntax highlighting
+TS_PKGS = [
+    'tree_sitter_python',
+    'tree_sitter_javascript',
+    'tree_sitter_html',
+    'tree_sitter_css',
+    'tree_sitter_json',
+    'tree_sitter_yaml',
+    'tree_sitter_toml',
+    'tree_sitter_markdown',
+    'tree_sitter_rust',
+    'tree_sitter_go',
+    'tree_sitter_bash',
+    'tree_sitter_sql',
+    'tree_sitter_java',
+    'tree_sitter_xml',
+    'tree_sitter_regex',
+]
 
 
 def get_platform():
@@ -39,30 +91,261 @@ def get_platform():
         return 'linux'
 
 
+def _parallel_rmtree(path, workers=8):
+    """
+    Delete a directory tree, unlinking files from a thread pool.
+
+    PyInstaller's build/ and dist/ trees hold thousands of small files;
+    issuing the unlinks concurrently hides per-syscall latency.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    dirs = []
+    unlinks = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        stack = [os.fspath(path)]
+        while stack:
+            current = stack.pop()
+            dirs.append(current)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        unlinks.append(pool.submit(os.unlink, entry.path))
+        # Raise the first unlink error itself, rather than the "directory
+        # not empty" it would otherwise turn into below
+        for future in as_completed(unlinks):
+            future.result()
+    # Parents were recorded before their children, so remove in reverse
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
 def clean():
     """Remove build artifacts."""
+    from concurrent.futures import ThreadPoolExecutor
+
     print("Cleaning build artifacts...")
-    for dir_path in [BUILD_DIR, DIST_DIR]:
-        if dir_path.exists():
-            shutil.rmtree(dir_path)
-            print(f"  Removed {dir_path}")
+    targets = [d for d in (BUILD_DIR, DIST_DIR) if d.exists()]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {pool.submit(_parallel_rmtree, d): d for d in targets}
+    for future, dir_path in futures.items():
+        future.result()
+        print(f"  Removed {dir_path}")
     if SPEC_FILE.exists():
         SPEC_FILE.unlink()
         print(f"  Removed {SPEC_FILE}")
     print("Clean complete.")
 
 
+def get_output_path(onefile=False):
+    """Get the path PyInstaller writes the built application to."""
+    if onefile and get_platform() == 'windows':
+        return DIST_DIR / f'{APP_NAME}.exe'
+    return DIST_DIR / APP_NAME
+
+
+def _hash_file(hasher, path):
+    """Feed a file's contents into hasher in 64 KiB chunks."""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            hasher.update(chunk)
+
+
+def _hash_sources():
+    """Hash the entry point and the onlycode/ source tree."""
+    import hashlib
+
+    hasher = hashlib.sha256()
+    _hash_file(hasher, ROOT_DIR / 'run_onlycode.py')
+    source_dir = ROOT_DIR / 'onlycode'
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            hasher.update(str(path.relative_to(source_dir)).encode())
+            _hash_file(hasher, path)
+    return hasher.hexdigest()
+
+
+def _installed_distributions():
+    """
+    List every installed distribution as 'name==version', sorted.
+
+    PyInstaller bundles textual, the tree-sitter grammars and whatever they
+    import in turn (rich, pygments, ...), so any upgrade in the environment
+    can change the build output; listing them all is simpler than tracing
+    which ones end up in dist/.
+    """
+    import importlib.metadata
+
+    return sorted(
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in importlib.metadata.distributions()
+    )
+
+
+def _compute_cache_key(cmd, sources_digest, distributions):
+    """
+    Hash everything that affects the build output: the sources (see
+    _hash_sources), the generated spec, the interpreter and PyInstaller
+    versions, the installed packages (see _installed_distributions) and
+    the PyInstaller arguments.
+    """
+    import hashlib
+    import PyInstaller
+
+    hasher = hashlib.sha256()
+    hasher.update(sources_digest.encode())
+    hasher.update('\0'.join(distributions).encode())
+    _hash_file(hasher, SPEC_FILE)
+    hasher.update(sys.version.encode())
+    hasher.update(PyInstaller.__version__.encode())
+    hasher.update('\0'.join(cmd).encode())
+    return hasher.hexdigest()
+
+
+def _read_build_stamp():
+    """Return the stamp of the build in dist/ ('' if none is recorded)."""
+    try:
+        return BUILD_STAMP.read_text(encoding='utf-8').strip()
+    except OSError:
+        return ''
+
+
+def _dir_size(root):
+    """Total size in bytes of regular files under root (symlinks not followed)."""
+    total = 0
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return total
+
+
+def get_grammar_packages():
+    """Return the tree-sitter grammars that are actually installed.
+
+    PyInstaller scans every --collect-all package during analysis, so
+    skipping missing grammars avoids a wasted lookup (and warning) each.
+    """
+    import importlib.util
+    return [pkg for pkg in TS_PKGS if importlib.util.find_spec(pkg) is not None]
+
+
+SPEC_TEMPLATE = """\
+# -*- mode: python ; coding: utf-8 -*-
+# Generated by build.py - edit the constants there instead of this file
+from PyInstaller.utils.hooks import collect_all
+
+datas = [('onlycode', 'onlycode')]
+binaries = []
+hiddenimports = {hidden_imports!r}
+for package in {collect_all!r}:
+    pkg_datas, pkg_binaries, pkg_hiddenimports = collect_all(package)
+    datas += pkg_datas
+    binaries += pkg_binaries
+    hiddenimports += pkg_hiddenimports
+
+a = Analysis(
+    ['run_onlycode.py'],
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+"""
+
+# TUI app - always a console executable
+SPEC_EXE_OPTIONS = """\
+    name={name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,{icon}
+"""
+
+SPEC_ONEDIR_TEMPLATE = """
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+{exe_options})
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name={name!r},
+)
+"""
+
+SPEC_ONEFILE_TEMPLATE = """
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    upx_exclude=[],
+    runtime_tmpdir=None,
+{exe_options})
+"""
+
+
+def _write_spec(onefile=False, icon_path=None):
+    """
+    Write SPEC_FILE from the constants above.
+
+    PyInstaller takes the spec as its input directly instead of turning a
+    long argv into one on every run. The file is only rewritten when its
+    contents change, so its mtime stays stable across identical builds.
+    """
+    collect = list(dict.fromkeys(COLLECT_ALL + get_grammar_packages()))
+    icon = f"\n    icon=[{str(icon_path)!r}]," if icon_path else ''
+    exe_options = SPEC_EXE_OPTIONS.format(name=APP_NAME, icon=icon)
+    tail = SPEC_ONEFILE_TEMPLATE if onefile else SPEC_ONEDIR_TEMPLATE
+    spec = SPEC_TEMPLATE.format(
+        hidden_imports=list(dict.fromkeys(HIDDEN_IMPORTS)),
+        collect_all=collect,
+    ) + tail.format(name=APP_NAME, exe_options=exe_options)
+
+    if not SPEC_FILE.exists() or SPEC_FILE.read_text(encoding='utf-8') != spec:
+        SPEC_FILE.write_text(spec, encoding='utf-8')
+    return SPEC_FILE
+
+
 def check_dependencies():
     """Check that required build dependencies are installed."""
     print("Checking dependencies...")
+    import importlib.util
+
     # Map display name to import name
     required = {'PyInstaller': 'PyInstaller', 'textual': 'textual'}
-    missing = []
-    for display_name, import_name in required.items():
-        try:
-            __import__(import_name)
-        except ImportError:
-            missing.append(display_name)
+    # find_spec only locates the package; importing textual would run it
+    missing = [display_name for display_name, import_name in required.items()
+               if importlib.util.find_spec(import_name) is None]
     if missing:
         print(f"\nMissing dependencies: {', '.join(missing)}")
         print("Install with: pip install " + ' '.join(missing))
@@ -71,76 +354,87 @@ def check_dependencies():
     return True
 
 
-def build(onefile=False):
-    """Build the application."""
+def build(onefile=False, full_clean=False, report_size=True):
+    """
+    Build the application.
+
+    report_size can be turned off when package() runs next, since it
+    reports the size from its own pass over the output tree.
+    """
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
     platform = get_platform()
     print(f"\n{'='*50}")
     print(f"Building Only Code for {platform}")
     print(f"{'='*50}\n")
 
+    # Hashing the source tree and listing the installed packages are
+    # independent of the dependency check and spec generation below, so
+    # let them run alongside them
+    hash_pool = ThreadPoolExecutor(max_workers=1)
+    sources_future = hash_pool.submit(_hash_sources)
+    distributions_future = hash_pool.submit(_installed_distributions)
+    hash_pool.shutdown(wait=False)
+
     if not check_dependencies():
         sys.exit(1)
 
-    # Build command
-    cmd = [
-        sys.executable, '-m', 'PyInstaller',
-        '--noconfirm',
-        '--clean',
-        '--name', APP_NAME,
-        '--add-data', f'onlycode:onlycode',
-        '--hidden-import', 'onlycode',
-        '--hidden-import', 'onlycode.app',
-        '--hidden-import', 'onlycode.app.application',
-        '--hidden-import', 'onlycode.app.screens',
-        '--hidden-import', 'onlycode.app.widgets',
-        '--hidden-import', 'onlycode.editor',
-        '--hidden-import', 'textual',
-        '--hidden-import', 'tree_sitter',
-        '--collect-all', 'textual',
-        '--collect-all', 'tree_sitter',
-        # Tree-sitter language packages for syntax highlighting
-        '--collect-all', 'tree_sitter_python',
-        '--collect-all', 'tree_sitter_javascript',
-        '--collect-all', 'tree_sitter_html',
-        '--collect-all', 'tree_sitter_css',
-        '--collect-all', 'tree_sitter_json',
-        '--collect-all', 'tree_sitter_yaml',
-        '--collect-all', 'tree_sitter_toml',
-        '--collect-all', 'tree_sitter_markdown',
-        '--collect-all', 'tree_sitter_rust',
-        '--collect-all', 'tree_sitter_go',
-        '--collect-all', 'tree_sitter_bash',
-        '--collect-all', 'tree_sitter_sql',
-        '--collect-all', 'tree_sitter_java',
-        '--collect-all', 'tree_sitter_xml',
-        '--collect-all', 'tree_sitter_regex',
-    ]
-
-    if onefile:
-        cmd.append('--onefile')
-
-    # Add icon based on platform (PyInstaller only supports icons on Windows/macOS)
+    # Icon based on platform (PyInstaller only supports icons on Windows/macOS)
+    icon_path = None
     if platform == 'windows':
         icon_path = IMAGES_DIR / 'tui-editor.ico'
-        if icon_path.exists():
-            cmd.extend(['--icon', str(icon_path)])
     elif platform == 'macos':
         # macOS uses .icns or .png
         icon_path = IMAGES_DIR / 'tui-editor-512.png'
-        if icon_path.exists():
-            cmd.extend(['--icon', str(icon_path)])
     # Note: Linux doesn't support embedded icons - use .desktop file instead
+    if icon_path is not None and not icon_path.exists():
+        icon_path = None
 
-    # TUI app - always use console
-    cmd.append('--console')
-    cmd.append('run_onlycode.py')
-
-    print(f"Running: {' '.join(cmd)}\n")
-    result = subprocess.run(cmd, cwd=ROOT_DIR)
+    _write_spec(onefile=onefile, icon_path=icon_path)
 
-    if result.returncode != 0:
-        print("\nBuild failed!")
-        sys.exit(1)
+    # Build command
+    cmd = [sys.executable, '-m', 'PyInstaller', '--noconfirm']
+
+    # Reuse PyInstaller's analysis cache unless a cold rebuild is requested
+    if full_clean:
+        cmd.append('--clean')
+
+    cmd.append(str(SPEC_FILE))
+
+    # Skip PyInstaller entirely if nothing changed since the last build
+    cache_key = _compute_cache_key(
+        cmd, sources_future.result(), distributions_future.result())
+    # Only one stamp is kept, for whatever build dist/ holds now, so a hit
+    # means dist/ really is this key's output (and of this output type)
+    stamp = f"{cache_key} {'onefile' if onefile else 'onedir'}"
+    output_path = get_output_path(onefile)
+    output_present = output_path.is_file() if onefile else output_path.is_dir()
+    if not full_clean and output_present and _read_build_stamp() == stamp:
+        print(f"Build cache: hit ({cache_key[:12]}), skipping PyInstaller")
+    else:
+        print(f"Build cache: miss ({cache_key[:12]})")
+        # PyInstaller is about to overwrite dist/; until it succeeds, the
+        # stamp must not vouch for what's there
+        BUILD_STAMP.unlink(missing_ok=True)
+        # Keep PyInstaller's bootloader/UPX cache next to the project so it
+        # survives temp cleanups, and don't litter the tree with .pyc files.
+        # PYTHONNOUSERSITE is deliberately not set: the build dependencies
+        # may well be installed with pip --user.
+        PYINSTALLER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        env = os.environ.copy()
+        env['PYTHONDONTWRITEBYTECODE'] = '1'
+        env['PYINSTALLER_CONFIG_DIR'] = str(PYINSTALLER_CONFIG_DIR)
+
+        print(f"Running: {' '.join(cmd)}\n")
+        result = subprocess.run(cmd, cwd=ROOT_DIR, env=env, check=False)
+
+        if result.returncode != 0:
+            print("\nBuild failed!")
+            sys.exit(1)
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        BUILD_STAMP.write_text(stamp + '\n', encoding='utf-8')
 
     # Post-build info
     print(f"\n{'='*50}")
@@ -148,10 +442,7 @@ def build(onefile=False):
     print(f"{'='*50}")
 
     if onefile:
-        if platform == 'windows':
-            output = DIST_DIR / f'{APP_NAME}.exe'
-        else:
-            output = DIST_DIR / APP_NAME
+        output = get_output_path(onefile=True)
         if output.exists():
             print(f"\nOutput: {output}")
             print(f"Size: {output.stat().st_size / (1024*1024):.1f} MB")
@@ -160,8 +451,9 @@ def build(onefile=False):
         output_dir = DIST_DIR / APP_NAME
         if output_dir.exists():
             print(f"\nOutput: {output_dir}")
-            total_size = sum(f.stat().st_size for f in output_dir.rglob('*') if f.is_file())
-            print(f"Size: {total_size / (1024*1024):.1f} MB")
+            if report_size:
+                total_size = _dir_size(output_dir)
+                print(f"Size: {total_size / (1024*1024):.1f} MB")
             if platform == 'windows':
                 print(f"\nTo run: {output_dir / f'{APP_NAME}.exe'}")
             else:
@@ -170,6 +462,47 @@ def build(onefile=False):
     return DIST_DIR
 
 
+def _external_tar_gz(source, archive_path):
+    """
+    Create a .tar.gz with the system tar and pigz (parallel gzip).
+
+    Returns False if either tool is missing so the caller can fall back
+    to tarfile.
+    """
+    if not (shutil.which('tar') and shutil.which('pigz')):
+        return False
+    import subprocess
+
+    compressor = f'pigz -p {os.cpu_count() or 1} -{ARCHIVE_COMPRESSLEVEL}'
+    subprocess.check_call([
+        'tar', '--use-compress-program', compressor,
+        '-cf', str(archive_path), '-C', str(source.parent), source.name,
+    ])
+    return True
+
+
+def _external_zip(source, archive_path):
+    """
+    Create a .zip with the system zip tool.
+
+    Returns False if zip is missing so the caller can fall back to zipfile.
+    """
+    if not shutil.which('zip'):
+        return False
+    import subprocess
+
+    # zip updates existing archives in place, so start from scratch
+    if archive_path.exists():
+        archive_path.unlink()
+    stored = ':'.join(sorted(STORED_SUFFIXES))
+    subprocess.check_call(
+        ['zip', '-r', f'-{ARCHIVE_COMPRESSLEVEL}', '-q', '-n', stored,
+         str(archive_path), source.name],
+        cwd=source.parent,
+    )
+    return True
+
+
 def package(onefile=False):
     """Create distributable archive from built application."""
     import tarfile
@@ -182,43 +515,63 @@ def package(onefile=False):
     print(f"{'='*50}\n")
 
     # Determine what to package
-    if onefile:
-        if platform == 'windows':
-            source = DIST_DIR / f'{APP_NAME}.exe'
-        else:
-            source = DIST_DIR / APP_NAME
-    else:
-        source = DIST_DIR / APP_NAME
+    source = get_output_path(onefile)
 
     if not source.exists():
         print(f"Error: {source} not found. Run build first.")
         sys.exit(1)
 
+    # Size of what was archived, taken from the archive's own member list
+    # where possible rather than from a second walk over the tree
+    source_size = None
+
     # Create archive name with version and platform
     archive_base = f'{APP_NAME}-{APP_VERSION}-{platform}'
 
     if platform == 'linux':
         archive_path = DIST_DIR / f'{archive_base}.tar.gz'
         print(f"Creating {archive_path.name}...")
-        with tarfile.open(archive_path, 'w:gz') as tar:
-            if onefile:
-                tar.add(source, arcname=source.name)
-            else:
-                tar.add(source, arcname=APP_NAME)
+        if not _external_tar_gz(source, archive_path):
+            with open(archive_path, 'wb', buffering=ARCHIVE_BUFFER_SIZE) as raw, \
+                    tarfile.open(fileobj=raw, mode='w:gz', compresslevel=ARCHIVE_COMPRESSLEVEL) as tar:
+                if onefile:
+                    tar.add(source, arcname=source.name)
+                else:
+                    tar.add(source, arcname=APP_NAME)
+                source_size = sum(member.size for member in tar.getmembers())
     else:  # windows or macos
         archive_path = DIST_DIR / f'{archive_base}.zip'
         print(f"Creating {archive_path.name}...")
-        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            if onefile:
-                zf.write(source, source.name)
-            else:
-                for file in source.rglob('*'):
-                    if file.is_file():
-                        arcname = Path(APP_NAME) / file.relative_to(source)
-                        zf.write(file, arcname)
+        # Windows has no zip on PATH by default; keep the pure-Python path there
+        if platform == 'windows' or not _external_zip(source, archive_path):
+            with open(archive_path, 'wb', buffering=ARCHIVE_BUFFER_SIZE) as raw, \
+                    zipfile.ZipFile(raw, 'w', zipfile.ZIP_DEFLATED,
+                                    compresslevel=ARCHIVE_COMPRESSLEVEL) as zf:
+                if onefile:
+                    zf.write(source, source.name)
+                else:
+                    # Build arcnames with plain string ops; Path objects per
+                    # entry dominate the cost on large PyInstaller trees
+                    src_str = str(source)
+                    prefix_len = len(src_str) + 1
+                    for dirpath, _, filenames in os.walk(src_str):
+                        rel_dir = dirpath[prefix_len:]
+                        arc_dir = os.path.join(APP_NAME, rel_dir) if rel_dir else APP_NAME
+                        for filename in filenames:
+                            full = os.path.join(dirpath, filename)
+                            arcname = os.path.join(arc_dir, filename)
+                            if os.path.splitext(filename)[1].lower() in STORED_SUFFIXES:
+                                zf.write(full, arcname, compress_type=zipfile.ZIP_STORED)
+                            else:
+                                zf.write(full, arcname)
+                source_size = sum(info.file_size for info in zf.infolist())
+
+    if source_size is None:
+        source_size = source.stat().st_size if onefile else _dir_size(source)
 
     archive_size = archive_path.stat().st_size / (1024 * 1024)
-    print(f"\nPackage created: {archive_path}")
+    print(f"\nPackaged {source.name}: {source_size / (1024 * 1024):.1f} MB")
+    print(f"Package created: {archive_path}")
     print(f"Size: {archive_size:.1f} MB")
 
     return archive_path
@@ -229,6 +582,7 @@ def main():
     parser.add_argument('--clean', action='store_true', help='Clean build artifacts')
     parser.add_argument('--onefile', action='store_true', help='Build single executable')
     parser.add_argument('--package', action='store_true', help='Create distributable archive after build')
+    parser.add_argument('--full-clean', action='store_true', help='Discard PyInstaller cache and re-analyze everything')
 
     args = parser.parse_args()
 
@@ -237,7 +591,7 @@ def main():
         if not args.onefile and not args.package:
             return
 
-    build(onefile=args.onefile)
+    build(onefile=args.onefile, full_clean=args.full_clean, report_size=not args.package)
 
     if args.package:
         package(onefile=args.onefile)
@@ -16,11 +16,30 @@ class OnlyCodeApp(App):
         ("q", "quit", "Quit"),
     ]
 
+    # (screen, commands) built by get_system_commands on first palette open
+    _system_commands_cache = (None, ())
+
+    # Widgets looked up once and reused by the action handlers
+    _editor: OnlyCodeEditor | None = None
+    _browser: FileBrowser | None = None
+
     def on_mount(self) -> None:
         self.push_screen(MainScreen())
         # Delay initial sync until screen is fully mounted
         self.set_timer(0.2, self._sync_syntax_theme)
 
+    def _get_editor(self) -> OnlyCodeEditor:
+        """Get the main screen's editor, querying the DOM only on first use."""
+        if self._editor is None or not self._editor.is_attached:
+            self._editor = self.screen.query_one(OnlyCodeEditor)
+        return self._editor
+
+    async def _get_browser(self) -> FileBrowser:
+        """Get the main screen's file browser, mounting it on first use."""
+        if self._browser is None or not self._browser.is_attached:
+            self._browser = await self.screen.ensure_file_browser()
+        return self._browser
+
     def watch_theme(self, old_theme: str, new_theme: str) -> None:
         """Called when the UI theme changes."""
         self._sync_syntax_theme()
@@ -28,8 +47,7 @@ class OnlyCodeApp(App):
     def _sync_syntax_theme(self) -> None:
         """Sync syntax highlighting theme with UI theme."""
         try:
-            screen = self.screen
-            editor = screen.query_one(OnlyCodeEditor)
+            editor = self._get_editor()
             editor.set_syntax_theme_for_ui(self.theme)
             editor.refresh()
         except Exception:
@@ -42,7 +60,7 @@ class OnlyCodeApp(App):
     def action_select_syntax_theme(self, theme: str) -> None:
         """Set syntax theme manually (user override)."""
         try:
-            editor = self.screen.query_one(OnlyCodeEditor)
+            editor = self._get_editor()
             editor.set_user_syntax_theme(theme)
             editor.refresh()
             self.notify(f"Syntax theme: {theme}")
@@ -52,7 +70,7 @@ class OnlyCodeApp(App):
     def action_reset_syntax_theme(self) -> None:
         """Reset syntax theme to auto-match UI theme."""
         try:
-            editor = self.screen.query_one(OnlyCodeEditor)
+            editor = self._get_editor()
             editor.clear_user_syntax_theme()
             editor.set_syntax_theme_for_ui(self.theme)
             editor.refresh()
@@ -63,7 +81,7 @@ class OnlyCodeApp(App):
     def action_set_indent_width(self, width: int) -> None:
         """Set the indent width (number of spaces per indent level)."""
         try:
-            editor = self.screen.query_one(OnlyCodeEditor)
+            editor = self._get_editor()
             editor.indent_width = width
             self.notify(f"Indent width: {width}")
         except Exception:
@@ -72,7 +90,7 @@ class OnlyCodeApp(App):
     def action_set_indent_type(self, indent_type: str) -> None:
         """Set indent type to spaces or tabs."""
         try:
-            editor = self.screen.query_one(OnlyCodeEditor)
+            editor = self._get_editor()
             editor.indent_type = indent_type
             self.notify(f"Indent type: {indent_type}")
         except Exception:
@@ -81,7 +99,7 @@ class OnlyCodeApp(App):
     def action_toggle_soft_wrap(self) -> None:
         """Toggle soft wrap on/off."""
         try:
-            editor = self.screen.query_one(OnlyCodeEditor)
+            editor = self._get_editor()
             editor.soft_wrap = not editor.soft_wrap
             status = "on" if editor.soft_wrap else "off"
             self.notify(f"Soft wrap: {status}")
@@ -91,36 +109,36 @@ class OnlyCodeApp(App):
     def action_toggle_auto_indent(self) -> None:
         """Toggle auto-indent on/off."""
         try:
-            editor = self.screen.query_one(OnlyCodeEditor)
+            editor = self._get_editor()
             editor.auto_indent = not editor.auto_indent
             status = "on" if editor.auto_indent else "off"
             self.notify(f"Auto-indent: {status}")
         except Exception:
             pass
 
-    def action_browse_home(self) -> None:
+    async def action_browse_home(self) -> None:
         """Set file browser root to home directory."""
         try:
-            browser = self.screen.query_one(FileBrowser)
+            browser = await self._get_browser()
             home = str(Path.home())
             browser.set_root(home)
             self.notify(f"Browse: ~")
         except Exception:
             pass
 
-    def action_browse_root(self) -> None:
+    async def action_browse_root(self) -> None:
         """Set file browser root to filesystem root."""
         try:
-            browser = self.screen.query_one(FileBrowser)
+            browser = await self._get_browser()
             browser.set_root("/")
             self.notify("Browse: /")
         except Exception:
             pass
 
-    def action_browse_cwd(self) -> None:
+    async def action_browse_cwd(self) -> None:
         """Set file browser root to current working directory."""
         try:
-            browser = self.screen.query_one(FileBrowser)
+            browser = await self._get_browser()
             cwd = os.getcwd()
             browser.set_root(cwd)
             # Shorten path for display
@@ -135,6 +153,16 @@ class OnlyCodeApp(App):
         # First yield all default system commands
         yield from super().get_system_commands(screen)
 
+        # Our own commands never change for a given screen, so build them
+        # once instead of on every palette open
+        cached_screen, commands = self._system_commands_cache
+        if cached_screen is not screen:
+            commands = tuple(self._build_system_commands(screen))
+            self._system_commands_cache = (screen, commands)
+        yield from commands
+
+    def _build_system_commands(self, screen):
+        """Build the editor-specific command palette entries."""
         # Add syntax theme selection commands
         for theme in SYNTAX_THEMES:
             yield SystemCommand(
@@ -5,40 +5,94 @@ from textual.events import Mount
 from pathlib import Path
 import os
 
+# Dialog stylesheets, kept at module level so each class body stays short
+_FILE_DIALOG_CSS = """
+FileDialog {
+    align: center middle;
+}
+#dialog-container {
+    width: 80%;
+    height: 80%;
+    border: solid $accent;
+    background: $surface;
+    padding: 1;
+}
+#path-display {
+    height: 1;
+    background: $primary-darken-2;
+    padding: 0 1;
+}
+#file-tree {
+    height: 1fr;
+    border: solid $secondary;
+}
+#filename-input {
+    margin: 1 0;
+}
+#buttons {
+    height: auto;
+    align: right middle;
+}
+Button {
+    margin-left: 1;
+}
+"""
+
+_NEW_FOLDER_CSS = """
+NewFolderDialog {
+    align: center middle;
+}
+#dialog-container {
+    width: 60;
+    height: auto;
+    border: solid $accent;
+    background: $surface;
+    padding: 1 2;
+}
+#target-display {
+    margin-bottom: 1;
+    color: $text-muted;
+}
+#buttons {
+    height: auto;
+    align: right middle;
+    margin-top: 1;
+}
+Button {
+    margin-left: 1;
+}
+"""
+
+_CONFIRM_CSS = """
+ConfirmCloseDialog {
+    align: center middle;
+}
+#dialog-container {
+    width: 50;
+    height: auto;
+    border: solid $accent;
+    background: $surface;
+    padding: 1 2;
+}
+#message {
+    margin: 1 0;
+    text-align: center;
+}
+#buttons {
+    height: auto;
+    align: center middle;
+    margin-top: 1;
+}
+Button {
+    margin: 0 1;
+}
+"""
+
+
 class FileDialog(ModalScreen[str]):
     """Base file dialog."""
 
-    DEFAULT_CSS = """
-    FileDialog {
-        align: center middle;
-    }
-    #dialog-container {
-        width: 80%;
-        height: 80%;
-        border: solid $accent;
-        background: $surface;
-        padding: 1;
-    }
-    #path-display {
-        height: 1;
-        background: $primary-darken-2;
-        padding: 0 1;
-    }
-    #file-tree {
-        height: 1fr;
-        border: solid $secondary;
-    }
-    #filename-input {
-        margin: 1 0;
-    }
-    #buttons {
-        height: auto;
-        align: right middle;
-    }
-    Button {
-        margin-left: 1;
-    }
-    """
+    DEFAULT_CSS = _FILE_DIALOG_CSS
 
     def __init__(self, title: str, initial_path: str | None = None):
         super().__init__()
@@ -64,9 +118,10 @@ class FileDialog(ModalScreen[str]):
         self.query_one(DirectoryTree).focus()
 
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected):
-        self.selected_path = event.path
-        self.current_dir = os.path.dirname(str(event.path))
-        self.query_one(Input).value = os.path.basename(event.path)
+        path = event.path
+        self.selected_path = path
+        self.current_dir = str(path.parent)
+        self.query_one(Input).value = path.name
         self._update_path_display()
 
     def on_directory_tree_directory_selected(self, event: DirectoryTree.DirectorySelected):
@@ -128,30 +183,7 @@ class OpenFolderDialog(FileDialog):
 class NewFolderDialog(ModalScreen[str]):
     """Dialog for creating a new folder inside a target directory."""
 
-    DEFAULT_CSS = """
-    NewFolderDialog {
-        align: center middle;
-    }
-    #dialog-container {
-        width: 60;
-        height: auto;
-        border: solid $accent;
-        background: $surface;
-        padding: 1 2;
-    }
-    #target-display {
-        margin-bottom: 1;
-        color: $text-muted;
-    }
-    #buttons {
-        height: auto;
-        align: right middle;
-        margin-top: 1;
-    }
-    Button {
-        margin-left: 1;
-    }
-    """
+    DEFAULT_CSS = _NEW_FOLDER_CSS
 
     def __init__(self, target_dir: str):
         super().__init__()
@@ -188,30 +220,7 @@ class NewFolderDialog(ModalScreen[str]):
 class ConfirmCloseDialog(ModalScreen[str]):
     """Dialog to confirm closing an unsaved file."""
 
-    DEFAULT_CSS = """
-    ConfirmCloseDialog {
-        align: center middle;
-    }
-    #dialog-container {
-        width: 50;
-        height: auto;
-        border: solid $accent;
-        background: $surface;
-        padding: 1 2;
-    }
-    #message {
-        margin: 1 0;
-        text-align: center;
-    }
-    #buttons {
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-    Button {
-        margin: 0 1;
-    }
-    """
+    DEFAULT_CSS = _CONFIRM_CSS
 
     def __init__(self, filename: str):
         super().__init__()
@@ -1,9 +1,9 @@
 import os
+from textual import work
 from textual.screen import Screen
 from textual.widgets import Header, Footer
 from textual.containers import Horizontal, Vertical
 from textual.binding import Binding
-from pathlib import Path
 from onlycode.editor.editor_widget import OnlyCodeEditor
 from onlycode.editor.buffer_manager import BufferManager, Buffer
 from onlycode.app.widgets.status_bar import StatusBar
@@ -11,7 +11,10 @@ from onlycode.app.widgets.tab_bar import TabBar, TabInfo
 from onlycode.app.widgets.file_browser import FileBrowser
 from onlycode.app.widgets.terminal_panel import TerminalPanel
 from onlycode.app.screens.file_dialogs import OpenFileDialog, OpenFolderDialog, SaveFileDialog, NewFolderDialog, ConfirmCloseDialog
-from onlycode.shared.config.session import SessionManager
+from onlycode.shared.config.session import SessionManager, existing_files
+
+# Seconds to wait before showing a cursor move, so rapid moves share a repaint
+CURSOR_UPDATE_DELAY = 1 / 60
 
 
 class MainScreen(Screen):
@@ -22,12 +25,14 @@ class MainScreen(Screen):
         layout: vertical;
     }
 
-    MainScreen #workspace {
+    MainScreen #main-container {
         height: 1fr;
     }
 
-    MainScreen #main-container {
-        height: 1fr;
+    /* Sits in the screen's flow below the status bar; docking it here
+       would put it on top of the footer. */
+    MainScreen #terminal-panel {
+        dock: none;
     }
 
     MainScreen #editor-container {
@@ -35,7 +40,7 @@ class MainScreen(Screen):
     }
     """
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("ctrl+o", "open_file", "Open", priority=True),
         Binding("ctrl+s", "save_file", "Save", priority=True),
         Binding("ctrl+t", "new_file", "New Tab", priority=True),
@@ -49,58 +54,69 @@ class MainScreen(Screen):
         # F7/F8 as fallback for next/prev tab
         Binding("f8", "next_buffer", "Next Tab", show=False, priority=True),
         Binding("f7", "prev_buffer", "Prev Tab", show=False, priority=True),
-        Binding("alt+1", "buffer_1", "Tab 1", show=False, priority=True),
-        Binding("alt+2", "buffer_2", "Tab 2", show=False, priority=True),
-        Binding("alt+3", "buffer_3", "Tab 3", show=False, priority=True),
-        Binding("alt+4", "buffer_4", "Tab 4", show=False, priority=True),
-        Binding("alt+5", "buffer_5", "Tab 5", show=False, priority=True),
-        Binding("alt+6", "buffer_6", "Tab 6", show=False, priority=True),
-        Binding("alt+7", "buffer_7", "Tab 7", show=False, priority=True),
-        Binding("alt+8", "buffer_8", "Tab 8", show=False, priority=True),
-        Binding("alt+9", "buffer_9", "Tab 9", show=False, priority=True),
+        # Alt+1..9 jump straight to a tab
+        *(
+            Binding(f"alt+{n}", f"jump_to_buffer({n - 1})", f"Tab {n}", show=False, priority=True)
+            for n in range(1, 10)
+        ),
         Binding("ctrl+q", "quit", "Quit", priority=True),
-    ]
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.buffer_manager = BufferManager()
         self.session_manager = SessionManager()
         self._loading_buffer = True  # Start True to prevent marking as modified during initial setup
+        self._last_cursor_pos = None  # Last position written to the status bar
+        self._pending_cursor_pos = None  # Latest position, not yet written
+        self._cursor_timer = None
+        self._saved_session = None  # Session state last restored or written
+        self._initial_buffer_id = None  # Empty buffer created during startup
+        self._shown_buffer_id = None  # Buffer whose text is in the editor
+        # Start file browser at the directory from which the app was launched
+        self._start_path = os.getcwd()
+        # The file browser and terminal start hidden and are mounted the first
+        # time they're needed (see _ensure_file_browser/_ensure_terminal)
+        self._file_browser: FileBrowser | None = None
+        self._file_tree = None
+        self._terminal: TerminalPanel | None = None
 
     def compose(self):
         yield Header()
-        # Start file browser at the directory from which the app was launched
-        start_path = os.getcwd()
-        with Vertical(id="workspace"):
-            with Horizontal(id="main-container"):
-                yield FileBrowser(path=start_path, id="file-browser", classes="hidden")
-                with Vertical(id="editor-container"):
-                    yield TabBar(id="tab-bar")
-                    yield OnlyCodeEditor(id="editor")
-            yield TerminalPanel(id="terminal-panel", classes="hidden")
-            yield StatusBar(id="status-bar")
+        with Horizontal(id="main-container"):
+            with Vertical(id="editor-container"):
+                yield TabBar(id="tab-bar")
+                yield OnlyCodeEditor(id="editor")
+        yield StatusBar(id="status-bar")
         yield Footer()
 
     def on_mount(self):
+        # Cache the widgets the handlers use; query_one walks the DOM. None of
+        # them are ever replaced, so the references stay valid.
+        self._editor = self.query_one(OnlyCodeEditor)
+        self._tab_bar = self.query_one(TabBar)
+        self._status_bar = self.query_one(StatusBar)
+
         # Try to restore session, or create initial buffer
         self._restore_session()
         if self.buffer_manager.buffer_count == 0:
-            self._create_new_buffer()
-        self.query_one(OnlyCodeEditor).focus()
-        # Delay enabling change detection until after Textual finishes setup
-        # Use set_timer to ensure this runs after all call_after_refresh callbacks
-        self.set_timer(0.1, self._enable_change_detection)
+            self._initial_buffer_id = self._create_new_buffer().id
+        self._editor.focus()
+        # Enable change detection once Textual finishes setup. Changed messages
+        # from loads that arrive later are ignored via dirty_since_snapshot.
+        self.call_after_refresh(self._enable_change_detection)
 
     def _enable_change_detection(self):
         """Enable change detection after initial setup is complete."""
         self._loading_buffer = False
-        # Reset any modified flags that may have been set during setup
-        tab_bar = self.query_one(TabBar)
-        for buffer in self.buffer_manager.get_all_buffers():
-            if not buffer.path and buffer.content == "":
-                # New empty buffer should not be marked as modified
-                buffer.is_modified = False
-                tab_bar.set_modified(buffer.id, False)
+        # Only the empty buffer created at startup can have picked up a
+        # modified flag during setup
+        if self._initial_buffer_id:
+            buffer = self.buffer_manager.get_buffer(self._initial_buffer_id)
+            self._initial_buffer_id = None
+            if buffer and not buffer.path and buffer.content == "":
+                self.buffer_manager.set_modified(buffer, False)
+                self._tab_bar.set_modified(buffer.id, False)
 
     def _create_new_buffer(self) -> Buffer:
         """Create a new buffer and add tab."""
@@ -108,67 +124,89 @@ class MainScreen(Screen):
         self._save_current_buffer_state()
 
         buffer = self.buffer_manager.create_buffer()
-        tab_bar = self.query_one(TabBar)
-        tab_bar.add_tab(TabInfo(
-            id=buffer.id,
-            name=buffer.name,
-            path=buffer.path,
-            is_modified=buffer.is_modified,
-        ))
+        self._add_tab(buffer)
         self._switch_to_buffer(buffer)
         return buffer
 
+    def _add_tab(self, buffer: Buffer) -> None:
+        """Add a tab for a buffer."""
+        self._tab_bar.add_tab(self._tab_info(buffer))
+
+    @staticmethod
+    def _tab_info(buffer: Buffer) -> TabInfo:
+        """Describe a buffer for the tab bar."""
+        return TabInfo(buffer.id, buffer.name, buffer.path, buffer.is_modified)
+
     def _save_current_buffer_state(self) -> None:
         """Save the current editor state to the active buffer."""
         current = self.buffer_manager.active_buffer
         if current:
-            editor = self.query_one(OnlyCodeEditor)
-            current.content = editor.text
+            editor = self._editor
+            # Copying the whole document out is only needed after an edit
+            if editor.dirty_since_snapshot:
+                current.content = editor.text
+                editor.dirty_since_snapshot = False
             current.cursor_position = editor.selection.end
 
     def _switch_to_buffer(self, buffer: Buffer) -> None:
         """Switch editor to show the given buffer."""
-        editor = self.query_one(OnlyCodeEditor)
+        if buffer.id == self._shown_buffer_id:
+            # Already in the editor; reloading would only re-parse the same text
+            self.buffer_manager.set_active(buffer.id)
+            return
+        if not self._load_placeholder(buffer):
+            shown = self.buffer_manager.get_buffer(self._shown_buffer_id)
+            if shown is not None:
+                # Keep the tab bar on the buffer that is still showing
+                self.buffer_manager.set_active(shown.id)
+                self._tab_bar.set_active(shown.id)
+            else:
+                # The editor's text belongs to a closed buffer; show another
+                self._show_active_buffer()
+            return
+        editor = self._editor
 
         # Save current buffer state
         current = self.buffer_manager.active_buffer
         if current and current.id != buffer.id:
-            current.content = editor.text
+            if editor.dirty_since_snapshot:
+                current.content = editor.text
             current.cursor_position = editor.selection.end
 
         # Load new buffer - set flag to prevent marking as modified
         self._loading_buffer = True
         self.buffer_manager.set_active(buffer.id)
-        editor.text = buffer.content
-        # Only apply syntax highlighting if Textual actually has a tree-sitter
-        # grammar for this language; otherwise fall back to plain text instead
-        # of crashing with LanguageDoesNotExist.
-        editor.language = (
-            buffer.language if buffer.language in editor.available_languages else None
-        )
-
-        # Update UI
-        tab_bar = self.query_one(TabBar)
-        tab_bar.set_active(buffer.id)
-
-        # Detect line ending from content
-        line_ending = "CRLF" if "\r\n" in buffer.content else "LF"
-
-        self.update_status_bar(
-            path=str(buffer.path) if buffer.path else buffer.name,
-            modified=buffer.is_modified,
-            language=buffer.language,
-            encoding="UTF-8",
-            line_ending=line_ending
-        )
-
-        # Delay re-enabling change detection until after events are processed
-        # Use set_timer to ensure this runs after all async TextArea events
-        def finish_switch():
-            self._loading_buffer = False
-            # Ensure the buffer's modified state is correct in the UI
-            tab_bar.set_modified(buffer.id, buffer.is_modified)
-        self.set_timer(0.05, finish_switch)
+        self._shown_buffer_id = buffer.id
+        # Apply the editor, tab bar and status bar changes as one repaint
+        with self.app.batch_update():
+            editor.text = buffer.content
+            editor.dirty_since_snapshot = False
+            # Only apply syntax highlighting if Textual actually has a tree-sitter
+            # grammar for this language; otherwise fall back to plain text instead
+            # of crashing with LanguageDoesNotExist.
+            editor.language = (
+                buffer.language if buffer.language in editor.available_languages else None
+            )
+
+            # Update UI
+            self._tab_bar.set_active(buffer.id)
+            self._tab_bar.set_modified(buffer.id, buffer.is_modified)
+
+            self.update_status_bar(
+                path=buffer.path or buffer.name,
+                modified=buffer.is_modified,
+                language=buffer.language,
+                encoding=buffer.encoding,
+                line_ending=buffer.line_ending
+            )
+
+        # Re-enable change detection after the refresh; a late Changed from
+        # the load above is ignored because dirty_since_snapshot is False
+        self.call_after_refresh(self._finish_switch)
+
+    def _finish_switch(self) -> None:
+        """Re-enable change detection after a buffer switch."""
+        self._loading_buffer = False
 
     def action_new_file(self):
         self._create_new_buffer()
@@ -176,49 +214,67 @@ class MainScreen(Screen):
     def action_open_file(self):
         def open_file_callback(path: str | None):
             if path:
+                active = self.buffer_manager.active_buffer
+                if active and active.path == path:
+                    # Already showing this file; nothing to save or reload
+                    self.notify(f"Opened {path}")
+                    return
                 # Save current buffer state BEFORE opening new file
                 self._save_current_buffer_state()
 
                 buffer = self.buffer_manager.open_file(path)
                 if buffer:
-                    tab_bar = self.query_one(TabBar)
-                    # Check if tab already exists
-                    if buffer.id not in tab_bar.get_tab_ids():
-                        tab_bar.add_tab(TabInfo(
-                            id=buffer.id,
-                            name=buffer.name,
-                            path=buffer.path,
-                            is_modified=buffer.is_modified,
-                        ))
-                    self._switch_to_buffer(buffer)
+                    with self.app.batch_update():
+                        # Check if tab already exists
+                        if not self._tab_bar.has_tab(buffer.id):
+                            self._add_tab(buffer)
+                        self._switch_to_buffer(buffer)
                     self.notify(f"Opened {path}")
                 else:
                     self.notify(f"Failed to open {path}", severity="error")
 
         self.app.push_screen(OpenFileDialog(), open_file_callback)
 
+    async def ensure_file_browser(self) -> FileBrowser:
+        """Get the file browser, mounting it the first time it's needed."""
+        if self._file_browser is None:
+            browser = FileBrowser(path=self._start_path, id="file-browser", classes="hidden")
+            await self.query_one("#main-container").mount(browser, before=0)
+            self._file_browser = browser
+            self._file_tree = browser.query_one("#file-tree")
+        return self._file_browser
+
+    async def _ensure_terminal(self) -> TerminalPanel:
+        """Get the terminal panel, mounting it the first time it's needed."""
+        if self._terminal is None:
+            terminal = TerminalPanel(id="terminal-panel", classes="hidden")
+            await self.mount(terminal, after=self._status_bar)
+            self._terminal = terminal
+        return self._terminal
+
     def action_open_folder(self):
         """Re-root the file browser to a folder picked via a dialog."""
-        def open_folder_callback(path: str | None):
+        async def open_folder_callback(path: str | None):
             if not path:
                 return
             if not os.path.isdir(path):
                 self.notify(f"Not a folder: {path}", severity="error")
                 return
-            browser = self.query_one(FileBrowser)
+            browser = await self.ensure_file_browser()
             browser.set_root(path)
             browser.show()
             browser.focus_tree()
             self.notify(f"Browse: {path}")
 
         # Start browsing from wherever the file browser currently is rooted.
-        browser = self.query_one(FileBrowser)
-        self.app.push_screen(OpenFolderDialog(browser.root_path), open_folder_callback)
+        browser = self._file_browser
+        start = browser.root_path if browser else self._start_path
+        self.app.push_screen(OpenFolderDialog(start), open_folder_callback)
 
     def action_new_folder(self):
         """Create a new folder inside the currently browsed/selected directory."""
-        browser = self.query_one(FileBrowser)
-        target_dir = browser.get_target_directory()
+        browser = self._file_browser
+        target_dir = browser.get_target_directory() if browser else self._start_path
 
         def new_folder_callback(name: str | None):
             if not name:
@@ -232,7 +288,8 @@ class MainScreen(Screen):
             except OSError as e:
                 self.notify(f"Failed to create folder: {e}", severity="error")
                 return
-            browser.reload()
+            if browser:
+                browser.reload()
             self.notify(f"Created folder {new_path}")
 
         self.app.push_screen(NewFolderDialog(target_dir), new_folder_callback)
@@ -258,19 +315,52 @@ class MainScreen(Screen):
 
     def _save_buffer(self, buffer: Buffer, path: str) -> None:
         """Save buffer to file."""
-        editor = self.query_one(OnlyCodeEditor)
-        buffer.content = editor.text
-
-        if editor.save_file(path):
-            buffer.path = path
-            buffer.name = Path(path).name
-            buffer.is_modified = False
-
-            tab_bar = self.query_one(TabBar)
-            tab_bar.update_tab_name(buffer.id, buffer.name, buffer.path)
-            tab_bar.set_modified(buffer.id, False)
-            self.update_status_bar(path=path, modified=False)
-            self.notify(f"Saved {path}")
+        editor = self._editor
+        # Join the document once and write that same copy to disk
+        if editor.dirty_since_snapshot:
+            buffer.content = editor.text
+            editor.dirty_since_snapshot = False
+
+        saved_as = None
+        try:
+            saved = editor.save_file(path, buffer.content, buffer.encoding)
+        except UnicodeEncodeError:
+            # The text no longer fits the file's encoding (e.g. a latin-1
+            # file after typing a character latin-1 lacks): switch to UTF-8
+            # rather than leave the buffer unsaveable
+            saved_as = buffer.encoding
+            saved = editor.save_file(path, buffer.content, "utf-8")
+            if saved:
+                buffer.encoding = "utf-8"
+                self.update_status_bar(encoding="utf-8")
+
+        if saved:
+            was_modified = buffer.is_modified
+            line_ending = Buffer.detect_line_ending(buffer.content)
+            self.buffer_manager.set_modified(buffer, False)
+            # Only "Save As" to a new path renames the buffer
+            renamed = path != buffer.path
+
+            if line_ending != buffer.line_ending:
+                buffer.line_ending = line_ending
+                self.update_status_bar(line_ending=line_ending)
+
+            # Re-saving an unmodified file leaves the tab and status bar as is
+            if was_modified or renamed:
+                with self.app.batch_update():
+                    if renamed:
+                        self.buffer_manager.set_path(buffer, path)
+                        buffer.name = os.path.basename(path)
+                        self._tab_bar.update_tab_name(buffer.id, buffer.name, buffer.path)
+                    self._tab_bar.set_modified(buffer.id, False)
+                    self.update_status_bar(path=path, modified=False)
+            if saved_as is not None:
+                self.notify(
+                    f"Saved {path} as UTF-8: the text has characters {saved_as} can't encode",
+                    severity="warning",
+                )
+            else:
+                self.notify(f"Saved {path}")
         else:
             self.notify(f"Failed to save {path}", severity="error")
 
@@ -308,59 +398,67 @@ class MainScreen(Screen):
 
     def _do_close_buffer(self, buffer_id: str):
         """Actually close a buffer (after confirmation if needed)."""
-        tab_bar = self.query_one(TabBar)
-        tab_bar.remove_tab(buffer_id)
+        self._tab_bar.remove_tab(buffer_id)
         self.buffer_manager.close_buffer(buffer_id)
 
         # Switch to another buffer or create new one
-        if self.buffer_manager.active_buffer:
-            self._switch_to_buffer(self.buffer_manager.active_buffer)
-        else:
-            self._create_new_buffer()
+        self._show_active_buffer()
+
+    def _show_active_buffer(self) -> None:
+        """Show the active buffer in the editor, or a new one if none is left.
+
+        A placeholder whose file can't be read is closed by _load_placeholder
+        and another buffer becomes active, so keep going until one loads:
+        an unread placeholder must never stay active while the editor holds
+        another buffer's text, or saving would write that text to its file.
+        """
+        while True:
+            buffer = self.buffer_manager.active_buffer
+            if buffer is None:
+                self._create_new_buffer()
+                return
+            if self._load_placeholder(buffer):
+                self._switch_to_buffer(buffer)
+                return
 
 
     def action_next_buffer(self):
         """Switch to next buffer."""
         next_id = self.buffer_manager.get_next_buffer_id()
         if next_id:
-            self._save_current_buffer_state()
-            buffer = self.buffer_manager.get_buffer(next_id)
-            if buffer:
-                self._switch_to_buffer(buffer)
+            self._switch_to_buffer_id(next_id)
 
     def action_prev_buffer(self):
         """Switch to previous buffer."""
         prev_id = self.buffer_manager.get_prev_buffer_id()
         if prev_id:
-            self._save_current_buffer_state()
-            buffer = self.buffer_manager.get_buffer(prev_id)
-            if buffer:
-                self._switch_to_buffer(buffer)
+            self._switch_to_buffer_id(prev_id)
 
-    def _jump_to_buffer(self, index: int):
-        """Jump to buffer by index (0-based)."""
+    def action_jump_to_buffer(self, index: int):
+        """Jump to buffer by index (0-based, for Alt+1-9)."""
         buffer_id = self.buffer_manager.get_buffer_by_index(index)
         if buffer_id:
-            self._save_current_buffer_state()
-            buffer = self.buffer_manager.get_buffer(buffer_id)
-            if buffer:
-                self._switch_to_buffer(buffer)
+            self._switch_to_buffer_id(buffer_id)
 
-    def action_buffer_1(self): self._jump_to_buffer(0)
-    def action_buffer_2(self): self._jump_to_buffer(1)
-    def action_buffer_3(self): self._jump_to_buffer(2)
-    def action_buffer_4(self): self._jump_to_buffer(3)
-    def action_buffer_5(self): self._jump_to_buffer(4)
-    def action_buffer_6(self): self._jump_to_buffer(5)
-    def action_buffer_7(self): self._jump_to_buffer(6)
-    def action_buffer_8(self): self._jump_to_buffer(7)
-    def action_buffer_9(self): self._jump_to_buffer(8)
+    def _switch_to_buffer_id(self, buffer_id: str) -> None:
+        """Switch to an already-open buffer.
+
+        _switch_to_buffer saves the outgoing buffer itself, so callers don't
+        need _save_current_buffer_state() first. Re-selecting the buffer
+        that is already showing does nothing.
+        """
+        current = self.buffer_manager.active_buffer
+        if current and current.id == buffer_id:
+            return
+        buffer = self.buffer_manager.get_buffer(buffer_id)
+        if buffer:
+            self._switch_to_buffer(buffer)
 
     def action_quit(self):
         # Check for unsaved changes
-        unsaved = [b for b in self.buffer_manager.get_all_buffers() if b.is_modified]
+        unsaved = self.buffer_manager.modified_count
         if unsaved:
-            self.notify(f"{len(unsaved)} unsaved buffer(s). Save before quitting.", severity="warning")
+            self.notify(f"{unsaved} unsaved buffer(s). Save before quitting.", severity="warning")
             return
         # Save session before quitting
         self._save_session()
@@ -374,106 +472,169 @@ class MainScreen(Screen):
         encoding: str = None,
         line_ending: str = None
     ):
-        status_bar = self.query_one(StatusBar)
-        if path is not None:
-            status_bar.file_path = path
-        if modified is not None:
-            status_bar.is_modified = modified
-        if language is not None:
-            status_bar.language = language
-        if encoding is not None:
-            status_bar.encoding = encoding
-        if line_ending is not None:
-            status_bar.line_ending = line_ending
+        status_bar = self._status_bar
+        # One repaint for however many fields change
+        with self.app.batch_update():
+            if path is not None:
+                status_bar.file_path = path
+            if modified is not None:
+                status_bar.is_modified = modified
+            if language is not None:
+                status_bar.language = language
+            if encoding is not None:
+                status_bar.encoding = encoding
+            if line_ending is not None:
+                status_bar.line_ending = line_ending
 
     def on_text_area_changed(self, event):
         """Handle text changes - mark buffer as modified."""
         # Skip if we're loading a buffer (programmatic text change)
         if self._loading_buffer:
             return
+        # Late Changed message from a load whose text is already on the buffer
+        if not self._editor.dirty_since_snapshot:
+            return
 
         buffer = self.buffer_manager.active_buffer
-        if buffer:
-            buffer.is_modified = True
-            tab_bar = self.query_one(TabBar)
-            tab_bar.set_modified(buffer.id, True)
+        # Only the first edit after a load/save changes anything in the UI
+        if buffer is None or buffer.is_modified:
+            return
+        self.buffer_manager.set_modified(buffer, True)
+        with self.app.batch_update():
+            self._tab_bar.set_modified(buffer.id, True)
             self.update_status_bar(modified=True)
 
     def on_text_area_selection_changed(self, event):
         """Handle cursor movement."""
-        status_bar = self.query_one(StatusBar)
-        status_bar.cursor_position = event.selection.end
+        # Coalesce bursts (held arrow keys) into one status bar write per frame
+        self._pending_cursor_pos = event.selection.end
+        if self._cursor_timer is None:
+            self._cursor_timer = self.set_timer(CURSOR_UPDATE_DELAY, self._flush_cursor_position)
+
+    def _flush_cursor_position(self) -> None:
+        """Write the latest cursor position to the status bar."""
+        self._cursor_timer = None
+        pos = self._pending_cursor_pos
+        # Skip the reactive write when only the selection anchor moved
+        if pos == self._last_cursor_pos:
+            return
+        self._last_cursor_pos = pos
+        self._status_bar.cursor_position = pos
 
     def on_tab_bar_tab_selected(self, event: TabBar.TabSelected):
         """Handle tab selection from tab bar."""
-        self._save_current_buffer_state()
-        buffer = self.buffer_manager.get_buffer(event.tab_id)
-        if buffer:
-            self._switch_to_buffer(buffer)
+        self._switch_to_buffer_id(event.tab_id)
 
     def _restore_session(self) -> None:
-        """Restore the previous session (open files)."""
+        """Restore the previous session (open files).
+
+        Tabs are created straight away from placeholder buffers. Only the
+        active file is read, on a worker thread; the rest are read the
+        first time their tab is shown.
+        """
         session = self.session_manager.load_session()
         if not session or not session.open_files:
             return
 
-        tab_bar = self.query_one(TabBar)
+        # What is on disk now; _save_session only rewrites it if this changes
+        self._saved_session = (tuple(session.open_files), session.active_tab_index)
+
         active_buffer = None
+        # A path listed twice gets one tab; dict keeps first-seen order
+        unique_files = dict.fromkeys(session.open_files)
+        existing = existing_files(unique_files)
 
+        restored = {}
         for i, file_path_str in enumerate(session.open_files):
-            file_path = Path(file_path_str)
-            if file_path.exists():
-                buffer = self.buffer_manager.open_file(str(file_path))
-                if buffer:
-                    tab_bar.add_tab(TabInfo(
-                        id=buffer.id,
-                        name=buffer.name,
-                        path=buffer.path,
-                        is_modified=buffer.is_modified,
-                    ))
-                    # Track which buffer to activate
-                    if i == session.active_tab_index:
-                        active_buffer = buffer
+            buffer = restored.get(file_path_str)
+            if buffer is None and file_path_str in existing:
+                buffer = self.buffer_manager.add_placeholder(file_path_str)
+                restored[file_path_str] = buffer
+            # Track which buffer to activate (a duplicate maps to its first tab)
+            if buffer and i == session.active_tab_index:
+                active_buffer = buffer
+
+        # Mount all the restored tabs at once, with a single layout pass
+        with self.app.batch_update():
+            self._tab_bar.add_tabs([self._tab_info(b) for b in restored.values()])
+            if self.buffer_manager.buffer_count > 0:
+                if active_buffer is None:
+                    active_buffer = next(iter(self.buffer_manager.iter_buffers()))
+                self._tab_bar.set_active(active_buffer.id)
+
+        if active_buffer is not None:
+            self._read_session_file(active_buffer)
+
+    @work(thread=True, exclusive=True, exit_on_error=False)
+    def _read_session_file(self, buffer: Buffer) -> None:
+        """Read the active restored file off the UI thread, then show it."""
+        self.buffer_manager.load_contents(buffer)
+        self.app.call_from_thread(self._restore_session_contents, buffer)
+
+    def _restore_session_contents(self, active_buffer: Buffer) -> None:
+        """Show the active restored buffer; other tabs are read on first switch."""
+        if self.buffer_manager.active_buffer is not None:
+            # The user picked a tab (or opened a file) while this was read
+            return
+        if not self._load_placeholder(active_buffer):
+            active_buffer = next(
+                (b for b in self.buffer_manager.get_all_buffers() if self._load_placeholder(b)),
+                None,
+            )
 
         # Activate the correct buffer
         if active_buffer:
             self._switch_to_buffer(active_buffer)
-        elif self.buffer_manager.buffer_count > 0:
-            first = self.buffer_manager.get_all_buffers()[0]
-            self._switch_to_buffer(first)
-
-    def _save_session(self) -> None:
-        """Save current session (open files) for restoration."""
+        else:
+            self._initial_buffer_id = self._create_new_buffer().id
+
+    def _load_placeholder(self, buffer: Buffer) -> bool:
+        """Read a placeholder buffer's file, dropping its tab if that fails."""
+        if buffer.loaded or self.buffer_manager.load_contents(buffer):
+            return True
+        # File vanished or became unreadable since the session was saved
+        self._tab_bar.remove_tab(buffer.id)
+        self.buffer_manager.close_buffer(buffer.id)
+        self.notify(f"Failed to open {buffer.path}", severity="error")
+        return False
+
+    def _session_state(self, active_buffer: Buffer | None) -> tuple[tuple[str, ...], int]:
+        """Get the (open files, active index) pair that _save_session writes."""
         # Collect file paths from buffers that have paths (not Untitled)
         open_files = []
         active_index = 0
-        buffers = self.buffer_manager.get_all_buffers()
-        active_buffer = self.buffer_manager.active_buffer
-
-        for i, buffer in enumerate(buffers):
+        for buffer in self.buffer_manager.iter_buffers():
             if buffer.path:
-                open_files.append(str(buffer.path))
+                open_files.append(buffer.path)
                 if active_buffer and buffer.id == active_buffer.id:
                     active_index = len(open_files) - 1
+        return tuple(open_files), active_index
 
-        self.session_manager.save_session(open_files, active_index)
+    def _save_session(self) -> None:
+        """Save current session (open files) for restoration."""
+        state = self._session_state(self.buffer_manager.active_buffer)
+        # Skip the write when nothing changed since the session was restored
+        if state == self._saved_session:
+            return
+        open_files, active_index = state
+        self.session_manager.save_session(list(open_files), active_index)
+        self._saved_session = state
 
     def action_focus_editor(self):
         """Return focus to the editor."""
-        self.query_one(OnlyCodeEditor).focus()
+        self._editor.focus()
 
-    def action_toggle_file_browser(self):
+    async def action_toggle_file_browser(self):
         """Toggle the file browser panel, or focus it if visible but not focused."""
-        file_browser = self.query_one(FileBrowser)
+        file_browser = await self.ensure_file_browser()
 
         if file_browser.is_visible:
             # Check if file browser tree already has focus
             focused = self.app.focused
-            tree = file_browser.query_one("#file-tree")
-            if focused == tree:
+            if focused is self._file_tree:
                 # Already focused on tree - hide it
                 file_browser.hide()
-                self.query_one(OnlyCodeEditor).focus()
+                self._editor.focus()
             else:
                 # Visible but not focused - focus the tree
                 file_browser.focus_tree()
@@ -482,24 +643,15 @@ class MainScreen(Screen):
             file_browser.show()
             file_browser.focus_tree()
 
-    def action_toggle_terminal(self):
+    async def action_toggle_terminal(self):
         """Toggle the terminal panel, or focus it if visible but not focused."""
-        terminal = self.query_one(TerminalPanel)
+        terminal = await self._ensure_terminal()
 
         if terminal.is_visible:
-            # Check if terminal already has focus
-            focused = self.app.focused
-            terminal_has_focus = False
-            if focused:
-                try:
-                    terminal_has_focus = terminal in focused.ancestors_with_self
-                except Exception:
-                    pass
-
-            if terminal_has_focus:
+            if terminal.has_focus_within:
                 # Terminal is focused - hide it and return to editor
                 terminal.hide()
-                self.query_one(OnlyCodeEditor).focus()
+                self._editor.focus()
             else:
                 # Terminal is visible but not focused - just focus it
                 terminal.focus_input()
@@ -512,17 +664,11 @@ class MainScreen(Screen):
         """Handle global key events."""
         # Escape in terminal returns focus to editor
         if event.key == "escape":
-            terminal = self.query_one(TerminalPanel)
-            if terminal.is_visible:
-                # Check if focus is in terminal
-                try:
-                    focused = self.app.focused
-                    if focused and terminal in focused.ancestors_with_self:
-                        self.query_one(OnlyCodeEditor).focus()
-                        event.prevent_default()
-                        event.stop()
-                except Exception:
-                    pass
+            terminal = self._terminal
+            if terminal is not None and terminal.is_visible and terminal.has_focus_within:
+                self._editor.focus()
+                event.prevent_default()
+                event.stop()
 
     def on_file_browser_file_selected(self, event: FileBrowser.FileSelected):
         """Handle file selection from file browser."""
@@ -530,22 +676,15 @@ class MainScreen(Screen):
         # Check if file is already open
         existing = self.buffer_manager.get_buffer_by_path(path)
         if existing:
-            self._save_current_buffer_state()
-            buffer = self.buffer_manager.get_buffer(existing)
-            if buffer:
-                self._switch_to_buffer(buffer)
+            self._switch_to_buffer_id(existing)
         else:
+            # Save current buffer state BEFORE open_file makes the new one active
+            self._save_current_buffer_state()
             # Open new file
             buffer = self.buffer_manager.open_file(path)
             if buffer:
-                tab_bar = self.query_one(TabBar)
-                if buffer.id not in tab_bar.get_tab_ids():
-                    tab_bar.add_tab(TabInfo(
-                        id=buffer.id,
-                        name=buffer.name,
-                        path=buffer.path,
-                        is_modified=buffer.is_modified,
-                    ))
+                if not self._tab_bar.has_tab(buffer.id):
+                    self._add_tab(buffer)
                 self._switch_to_buffer(buffer)
         # Return focus to editor
-        self.query_one(OnlyCodeEditor).focus()
+        self._editor.focus()
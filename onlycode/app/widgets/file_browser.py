@@ -1,13 +1,16 @@
 # Only Code Editor - File Browser Widget
 from textual import events
 from textual.widgets import DirectoryTree, Static
+from textual.widgets.directory_tree import DirEntry
+from textual.widgets.tree import TreeNode
+from textual.worker import Worker
 from textual.containers import Vertical, ScrollableContainer
 from textual.widget import Widget
 from textual.reactive import reactive
 from textual.message import Message
 from textual.binding import Binding
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 import os
 
 
@@ -20,9 +23,49 @@ class FilteredDirectoryTree(DirectoryTree):
             super().__init__()
             self.path = path
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # is_dir answers from scandir, held until the listing is shown
+        self._is_dir_cache: dict[Path, bool] = {}
+
+    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
+        """List a directory with os.scandir, noting which entries are dirs.
+
+        DirectoryTree calls is_dir() on every entry twice (to sort, then to
+        build the node), a stat() each time; scandir already knows.
+        """
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    path = Path(entry.path)
+                    if entry.name[:1] != ".":
+                        try:
+                            self._is_dir_cache[path] = entry.is_dir()
+                        except OSError:
+                            self._is_dir_cache[path] = False
+                    yield path
+        except OSError:
+            pass
+
+    def _safe_is_dir(self, path: Path) -> bool:
+        is_dir = self._is_dir_cache.get(path)
+        if is_dir is None:
+            return DirectoryTree._safe_is_dir(path)
+        return is_dir
+
+    def _populate_node(self, node: TreeNode[DirEntry], content: Iterable[Path]) -> None:
+        super()._populate_node(node, content)
+        # The nodes now carry allow_expand; later checks go to the filesystem
+        for path in content:
+            self._is_dir_cache.pop(path, None)
+
     def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
         """Filter out hidden files and directories."""
-        return [p for p in paths if not p.name.startswith(".")]
+        # DirectoryTree sorts the result straight away, so a generator is
+        # enough; the slice compare avoids a method call per entry.
+        return (p for p in paths if p.name[:1] != ".")
 
     async def _on_click(self, event: events.Click) -> None:
         """Double-clicking a directory opens it as the new browser root."""
@@ -104,9 +147,11 @@ class FileBrowser(Widget):
     def __init__(self, path: str | None = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Default to home directory if no path specified
+        self._home = str(Path.home())
         if path is None:
-            path = str(Path.home())
+            path = self._home
         self.root_path = os.path.abspath(path)
+        self._short_path: tuple[str, str] | None = None  # (root_path, short form)
 
     def compose(self):
         yield Static("📁 Files", id="browser-header")
@@ -116,13 +161,16 @@ class FileBrowser(Widget):
 
     def _get_short_path(self) -> str:
         """Get shortened path for display (replace home with ~)."""
+        if self._short_path is not None and self._short_path[0] == self.root_path:
+            return self._short_path[1]
         path = self.root_path
-        home = str(Path.home())
+        home = self._home
         if path.startswith(home):
             path = "~" + path[len(home):]
         # Truncate if too long
         if len(path) > 32:
             path = "..." + path[-29:]
+        self._short_path = (self.root_path, path)
         return path
 
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected):
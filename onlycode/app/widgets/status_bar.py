@@ -42,6 +42,14 @@ LANGUAGE_DISPLAY_NAMES = {
 }
 
 
+# Display names for the codecs buffers are decoded with
+ENCODING_DISPLAY_NAMES = {
+    "utf-8": "UTF-8",
+    "utf-8-sig": "UTF-8 BOM",
+    "latin-1": "Latin-1",
+}
+
+
 class StatusBar(Widget):
     """A status bar widget showing file info, cursor position, language, encoding."""
 
@@ -96,54 +104,55 @@ class StatusBar(Widget):
     cursor_position = reactive((1, 1), init=False)
     is_modified = reactive(False, init=False)
     language = reactive("text", init=False)
-    encoding = reactive("UTF-8", init=False)
+    encoding = reactive("utf-8", init=False)
     line_ending = reactive("LF", init=False)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Built up front so the watchers can update them directly rather than
+        # querying the DOM on every keystroke
+        self._file_path_static = Static(self.file_path, id="file-path", classes="status-item")
+        self._modified_static = Static("", id="modified", classes="status-item")
+        self._cursor_static = Static(
+            f"Ln {self.cursor_position[0]}, Col {self.cursor_position[1]}",
+            id="cursor-pos",
+            classes="status-item",
+        )
+        self._language_static = Static(self._get_language_display(), id="language", classes="status-item")
+        self._encoding_static = Static(self._get_encoding_display(), id="encoding", classes="status-item")
+        self._line_ending_static = Static(self.line_ending, id="line-ending", classes="status-item")
+
     def compose(self):
-        yield Static(self.file_path, id="file-path", classes="status-item")
-        yield Static("", id="modified", classes="status-item")
-        yield Static(f"Ln {self.cursor_position[0]}, Col {self.cursor_position[1]}", id="cursor-pos", classes="status-item")
-        yield Static(self._get_language_display(), id="language", classes="status-item")
-        yield Static(self.encoding, id="encoding", classes="status-item")
-        yield Static(self.line_ending, id="line-ending", classes="status-item")
+        yield self._file_path_static
+        yield self._modified_static
+        yield self._cursor_static
+        yield self._language_static
+        yield self._encoding_static
+        yield self._line_ending_static
 
     def _get_language_display(self) -> str:
         """Get display name for current language."""
-        return LANGUAGE_DISPLAY_NAMES.get(self.language, self.language.title())
+        # title() only for languages missing from the table
+        return LANGUAGE_DISPLAY_NAMES.get(self.language) or self.language.title()
+
+    def _get_encoding_display(self) -> str:
+        """Get display name for current encoding."""
+        return ENCODING_DISPLAY_NAMES.get(self.encoding) or self.encoding.upper()
 
     def watch_file_path(self, path: str) -> None:
-        try:
-            self.query_one("#file-path", Static).update(path)
-        except Exception:
-            pass
+        self._file_path_static.update(path)
 
     def watch_cursor_position(self, pos: tuple[int, int]) -> None:
-        try:
-            self.query_one("#cursor-pos", Static).update(f"Ln {pos[0]}, Col {pos[1]}")
-        except Exception:
-            pass
+        self._cursor_static.update(f"Ln {pos[0]}, Col {pos[1]}")
 
     def watch_is_modified(self, modified: bool) -> None:
-        try:
-            indicator = "●" if modified else ""
-            self.query_one("#modified", Static).update(indicator)
-        except Exception:
-            pass
+        self._modified_static.update("●" if modified else "")
 
     def watch_language(self, lang: str) -> None:
-        try:
-            self.query_one("#language", Static).update(self._get_language_display())
-        except Exception:
-            pass
+        self._language_static.update(self._get_language_display())
 
     def watch_encoding(self, enc: str) -> None:
-        try:
-            self.query_one("#encoding", Static).update(enc)
-        except Exception:
-            pass
+        self._encoding_static.update(self._get_encoding_display())
 
     def watch_line_ending(self, ending: str) -> None:
-        try:
-            self.query_one("#line-ending", Static).update(ending)
-        except Exception:
-            pass
+        self._line_ending_static.update(ending)
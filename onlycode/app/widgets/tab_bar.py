@@ -1,5 +1,6 @@
 """Tab bar widget for multi-buffer support."""
 
+from rich.text import Text
 from textual.widget import Widget
 from textual.widgets import Static
 from textual.reactive import reactive
@@ -8,7 +9,7 @@ from textual.containers import Horizontal
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TabInfo:
     """Information about a tab/buffer."""
     id: str
@@ -59,20 +60,32 @@ class Tab(Static):
         super().__init__(**kwargs)
         self.tab_info = tab_info
         self.is_modified = tab_info.is_modified
+        self._label = self._make_label()
 
     def compose(self):
         return []  # Content set via render
 
-    def render(self) -> str:
+    def _make_label(self) -> Text:
+        # Text, not str: a str from render() is parsed as markup, which is
+        # wasted work and mangles names containing "["
         modified = "● " if self.is_modified else ""
-        return f"{modified}{self.tab_info.name}"
+        return Text(f"{modified}{self.tab_info.name}")
+
+    def update_label(self) -> None:
+        """Rebuild the label after the name or modified flag changes."""
+        self._label = self._make_label()
+        # The tab is auto-width, so a new label can change its size
+        self.refresh(layout=True)
+
+    def render(self) -> Text:
+        return self._label
 
     def watch_is_active(self, active: bool) -> None:
         self.set_class(active, "active")
 
     def watch_is_modified(self, modified: bool) -> None:
         self.tab_info.is_modified = modified
-        self.refresh()
+        self.update_label()
 
     def on_click(self) -> None:
         self.post_message(self.Selected(self.tab_info.id))
@@ -114,6 +127,18 @@ class TabBar(Widget):
         self.mount(tab)
         self.set_active(tab_info.id)
 
+    def add_tabs(self, tab_infos: list[TabInfo]) -> None:
+        """Add several tabs in one mount and activate the last."""
+        if not tab_infos:
+            return
+        tabs = []
+        for tab_info in tab_infos:
+            tab = Tab(tab_info, id=f"tab-{tab_info.id}")
+            self._tabs[tab_info.id] = tab
+            tabs.append(tab)
+        self.mount_all(tabs)
+        self.set_active(tab_infos[-1].id)
+
     def remove_tab(self, tab_id: str) -> None:
         """Remove a tab."""
         if tab_id in self._tabs:
@@ -125,6 +150,8 @@ class TabBar(Widget):
 
     def set_active(self, tab_id: str) -> None:
         """Set the active tab."""
+        if tab_id == self._active_tab_id:
+            return
         if self._active_tab_id and self._active_tab_id in self._tabs:
             self._tabs[self._active_tab_id].is_active = False
         if tab_id in self._tabs:
@@ -142,7 +169,11 @@ class TabBar(Widget):
             tab = self._tabs[tab_id]
             tab.tab_info.name = name
             tab.tab_info.path = path
-            tab.refresh()
+            tab.update_label()
+
+    def has_tab(self, tab_id: str) -> bool:
+        """Check whether a tab exists."""
+        return tab_id in self._tabs
 
     def get_tab_ids(self) -> list[str]:
         """Get list of tab IDs in order."""
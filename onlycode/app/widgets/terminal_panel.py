@@ -7,10 +7,19 @@ from textual.containers import Vertical
 from textual.widget import Widget
 from textual.message import Message
 from textual.binding import Binding
+from textual.worker import Worker
 from pathlib import Path
 import subprocess
 import asyncio
+import codecs
+from collections import deque
 import os
+import signal
+
+# Bytes read from a command's output at a time
+CHUNK_SIZE = 64 * 1024
+# Commands kept for up/down history
+HISTORY_LIMIT = 1000
 
 
 class TerminalPanel(Widget):
@@ -85,16 +94,22 @@ class TerminalPanel(Widget):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._working_dir = str(Path.home())
-        self._command_history: list[str] = []
+        # Oldest commands drop off once the limit is reached
+        self._command_history: deque[str] = deque(maxlen=HISTORY_LIMIT)
         self._history_index = -1
         self._running_process: asyncio.subprocess.Process | None = None
+        self._command_worker: Worker | None = None
+        # Children built up front so handlers use them without DOM queries
+        self._header = Static(self._get_header(), id="terminal-header")
+        self._output = Log(id="terminal-output", highlight=True, auto_scroll=True)
+        self._input = Input(placeholder="Enter command...", id="terminal-input")
 
     def compose(self):
-        yield Static(self._get_header(), id="terminal-header")
-        yield Log(id="terminal-output", highlight=True, auto_scroll=True)
+        yield self._header
+        yield self._output
         with Vertical(id="terminal-input-container"):
             yield Static(self._get_prompt(), id="terminal-prompt")
-            yield Input(placeholder="Enter command...", id="terminal-input")
+            yield self._input
 
     def _get_header(self) -> str:
         """Get terminal header with title and working directory."""
@@ -106,7 +121,7 @@ class TerminalPanel(Widget):
 
     def on_mount(self):
         """Set up terminal on mount."""
-        output = self.query_one("#terminal-output", Log)
+        output = self._output
         output.write_line("Terminal ready. Type commands and press Enter.")
         output.write_line(f"Working directory: {self._working_dir}")
         output.write_line("")
@@ -119,6 +134,9 @@ class TerminalPanel(Widget):
         command = event.value.strip()
         if not command:
             return
+        if self._command_worker is not None and self._command_worker.is_running:
+            self.notify("A command is still running; press Ctrl+C to stop it", severity="warning")
+            return
 
         # Clear input
         event.input.value = ""
@@ -127,12 +145,15 @@ class TerminalPanel(Widget):
         self._command_history.append(command)
         self._history_index = len(self._command_history)
 
-        # Execute command
-        await self._execute_command(command)
+        # Run the command in a worker so the panel keeps handling keys
+        # (Ctrl+C, history, Escape) while it runs
+        self._command_worker = self.run_worker(
+            self._execute_command(command), group="terminal-command", exit_on_error=False
+        )
 
     async def _execute_command(self, command: str):
         """Execute a shell command and display output."""
-        output = self.query_one("#terminal-output", Log)
+        output = self._output
 
         # Show the command being executed
         output.write_line(f"$ {command}")
@@ -142,7 +163,7 @@ class TerminalPanel(Widget):
             self._handle_cd(command[3:].strip())
             return
         elif command == "cd":
-            self._handle_cd(str(Path.home()))
+            self._handle_cd("~")
             return
         elif command == "clear":
             output.clear()
@@ -159,48 +180,73 @@ class TerminalPanel(Widget):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
                 cwd=self._working_dir,
+                # Own process group, so Ctrl+C stops whatever the shell started
+                start_new_session=True,
             )
             self._running_process = process
 
-            # Read output
-            stdout, _ = await process.communicate()
-            if stdout:
-                for line in stdout.decode().splitlines():
-                    output.write_line(line)
+            # Show output as it arrives rather than after the command exits.
+            # Read in chunks, not lines, so one huge line can't overrun the
+            # stream's buffer limit; the incremental decoder handles
+            # characters split across chunks.
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            lines: list[str] = []
+            pending = ""
+            while chunk := await process.stdout.read(CHUNK_SIZE):
+                new_lines = (pending + decoder.decode(chunk)).split("\n")
+                pending = new_lines.pop()
+                # One write (and one refresh) per chunk, not per line
+                output.write_lines([line.rstrip("\r") for line in new_lines])
+                lines.extend(new_lines)
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                output.write_line(pending)
+                lines.append(pending)
+            await process.wait()
 
             # Show return code if non-zero
             if process.returncode != 0:
                 output.write_line(f"[Exit code: {process.returncode}]")
 
             output.write_line("")
-            self.post_message(self.CommandExecuted(command, stdout.decode() if stdout else "", process.returncode))
+            self.post_message(self.CommandExecuted(command, "\n".join(lines), process.returncode))
 
+        except asyncio.CancelledError:
+            # The panel is going away; don't leave the command running
+            self._stop_running_process()
+            raise
         except Exception as e:
             output.write_line(f"Error: {e}")
             output.write_line("")
         finally:
             self._running_process = None
 
+    def _stop_running_process(self) -> bool:
+        """Terminate the running command. Returns False if none is running."""
+        process = self._running_process
+        if process is None or process.returncode is not None:
+            return False
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGTERM)
+            else:
+                process.terminate()
+        except ProcessLookupError:
+            pass
+        return True
+
     def _handle_cd(self, path: str):
         """Handle cd command."""
-        output = self.query_one("#terminal-output", Log)
-
-        # Handle ~ for home directory
-        if path.startswith("~"):
-            path = str(Path.home()) + path[1:]
-
-        # Resolve relative paths
-        if not os.path.isabs(path):
-            path = os.path.join(self._working_dir, path)
+        output = self._output
 
-        # Normalize path
-        path = os.path.normpath(path)
+        # Expand ~, resolve against the working directory (join keeps an
+        # absolute path as is) and normalize
+        path = os.path.normpath(os.path.join(self._working_dir, os.path.expanduser(path)))
 
         if os.path.isdir(path):
             self._working_dir = path
             # Update header
-            header = self.query_one("#terminal-header", Static)
-            header.update(self._get_header())
+            self._header.update(self._get_header())
             output.write_line(f"Changed to: {path}")
         else:
             output.write_line(f"cd: {path}: No such directory")
@@ -221,8 +267,7 @@ class TerminalPanel(Widget):
 
     def focus_input(self):
         """Focus the command input."""
-        input_widget = self.query_one("#terminal-input", Input)
-        input_widget.focus()
+        self._input.focus()
 
     @property
     def is_visible(self) -> bool:
@@ -238,8 +283,7 @@ class TerminalPanel(Widget):
         """Set the working directory."""
         if os.path.isdir(path):
             self._working_dir = path
-            header = self.query_one("#terminal-header", Static)
-            header.update(self._get_header())
+            self._header.update(self._get_header())
 
     def action_focus_editor(self):
         """Action to return focus to editor (handled by parent)."""
@@ -248,11 +292,17 @@ class TerminalPanel(Widget):
 
     def on_key(self, event):
         """Handle key events for command history."""
-        input_widget = self.query_one("#terminal-input", Input)
+        input_widget = self._input
         if not input_widget.has_focus:
             return
 
-        if event.key == "up":
+        if event.key == "ctrl+c":
+            # Stop a running command; otherwise leave Ctrl+C to the Input
+            if self._stop_running_process():
+                self._output.write_line("^C")
+                event.prevent_default()
+                event.stop()
+        elif event.key == "up":
             # Previous command in history
             if self._command_history and self._history_index > 0:
                 self._history_index -= 1
@@ -1,11 +1,90 @@
 """Buffer manager for multi-file editing."""
 
+import codecs
 from dataclasses import dataclass, field
-from pathlib import Path
+import mmap
+import os
+from typing import Iterable
 import uuid
 
 
-@dataclass
+# Files at least this big are decoded from an mmap instead of a read() copy
+MMAP_MIN_SIZE = 1024 * 1024
+
+# File extension to language mapping
+EXTENSION_TO_LANGUAGE = {
+    # Python
+    ".py": "python",
+    ".pyw": "python",
+    ".pyi": "python",
+    # JavaScript/TypeScript
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    # Web
+    ".json": "json",
+    ".html": "html",
+    ".htm": "html",
+    ".css": "css",
+    ".scss": "css",
+    ".sass": "css",
+    # Markdown
+    ".md": "markdown",
+    ".markdown": "markdown",
+    # Systems languages
+    ".rs": "rust",
+    ".go": "go",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".cxx": "cpp",
+    ".cc": "cpp",
+    ".hpp": "cpp",
+    ".hxx": "cpp",
+    # JVM languages
+    ".java": "java",
+    ".scala": "scala",
+    # Scripting languages
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "bash",
+    ".rb": "ruby",
+    ".lua": "lua",
+    ".r": "r",
+    ".R": "r",
+    ".rkt": "racket",
+    ".scm": "scheme",
+    # Config files
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".xml": "xml",
+    ".ini": "ini",
+    # Pascal/Delphi
+    ".pas": "pascal",
+    ".pp": "pascal",
+    ".dpr": "pascal",
+    # Legacy languages
+    ".bas": "basic",
+    ".vb": "basic",
+    ".vbs": "basic",
+    ".f": "fortran",
+    ".f90": "fortran",
+    ".f95": "fortran",
+    ".for": "fortran",
+    ".logo": "logo",
+    # Other
+    ".sql": "sql",
+    ".php": "php",
+    ".pl": "perl",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+}
+
+
+@dataclass(slots=True)
 class Buffer:
     """Represents an open file/buffer."""
     id: str
@@ -15,12 +94,15 @@ class Buffer:
     is_modified: bool = False
     cursor_position: tuple[int, int] = (0, 0)
     language: str = "python"
+    loaded: bool = True
+    line_ending: str = "LF"
+    encoding: str = "utf-8"
 
     @classmethod
     def create_new(cls, name: str = "Untitled") -> "Buffer":
         """Create a new untitled buffer."""
         return cls(
-            id=str(uuid.uuid4())[:8],
+            id=uuid.uuid4().hex[:12],
             name=name,
             content="",
             path=None,
@@ -30,92 +112,75 @@ class Buffer:
     @classmethod
     def from_file(cls, path: str) -> "Buffer":
         """Create a buffer from a file."""
-        file_path = Path(path)
-        content = file_path.read_text()
-        language = cls._detect_language(file_path.suffix)
+        buffer = cls.placeholder(path)
+        buffer.load()
+        return buffer
+
+    def load(self) -> None:
+        """Read and decode the buffer's file."""
+        with open(self.path, "rb") as f:
+            mm = None
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    pass  # Not mappable (e.g. a special file); read it
+            if mm is None:
+                self.set_loaded_content(f.read())
+                return
+        # Decode straight from the mapping, skipping the bytes copy of the
+        # whole file that read() would make first
+        with mm:
+            self.set_loaded_content(mm)
+
+    def set_loaded_content(self, raw: bytes | mmap.mmap) -> None:
+        """Decode a file's bytes and note its encoding and line ending."""
+        # utf-8-sig drops a leading BOM; saving with it writes the BOM back
+        encoding = "utf-8-sig" if raw[:3] == codecs.BOM_UTF8 else "utf-8"
+        # Decoding the bytes directly skips newline translation, so CRLF
+        # files keep their line endings (TextArea preserves them)
+        try:
+            content = str(raw, encoding)
+        except UnicodeDecodeError:
+            # Not UTF-8. latin-1 maps every byte to a character, so the file
+            # opens and saving writes the same bytes back.
+            encoding = "latin-1"
+            content = str(raw, encoding)
+        self.encoding = encoding
+        self.content = content
+        self.line_ending = self.detect_line_ending(self.content)
+        self.loaded = True
+
+    @staticmethod
+    def detect_line_ending(content: str) -> str:
+        """Detect the line ending from the start of the content."""
+        # The first few KB are enough; files rarely mix line endings
+        sample = content[:4096]
+        if "\r\n" in sample:
+            return "CRLF"
+        if "\r" in sample and "\n" not in sample:
+            return "CR"
+        return "LF"
+
+    @classmethod
+    def placeholder(cls, path: str) -> "Buffer":
+        """Create a buffer for a file whose contents are read later."""
+        # os.path string helpers avoid building a Path per restored file
+        name = os.path.basename(path)
         return cls(
-            id=str(uuid.uuid4())[:8],
-            name=file_path.name,
-            content=content,
+            id=uuid.uuid4().hex[:12],
+            name=name,
+            content="",
             path=path,
             is_modified=False,
-            language=language,
+            language=cls._detect_language(os.path.splitext(name)[1]),
+            loaded=False,
         )
 
     @staticmethod
     def _detect_language(suffix: str) -> str:
         """Detect language from file extension."""
-        language_map = {
-            # Python
-            ".py": "python",
-            ".pyw": "python",
-            ".pyi": "python",
-            # JavaScript/TypeScript
-            ".js": "javascript",
-            ".jsx": "javascript",
-            ".ts": "typescript",
-            ".tsx": "typescript",
-            # Web
-            ".json": "json",
-            ".html": "html",
-            ".htm": "html",
-            ".css": "css",
-            ".scss": "css",
-            ".sass": "css",
-            # Markdown
-            ".md": "markdown",
-            ".markdown": "markdown",
-            # Systems languages
-            ".rs": "rust",
-            ".go": "go",
-            ".c": "c",
-            ".h": "c",
-            ".cpp": "cpp",
-            ".cxx": "cpp",
-            ".cc": "cpp",
-            ".hpp": "cpp",
-            ".hxx": "cpp",
-            # JVM languages
-            ".java": "java",
-            ".scala": "scala",
-            # Scripting languages
-            ".sh": "bash",
-            ".bash": "bash",
-            ".zsh": "bash",
-            ".rb": "ruby",
-            ".lua": "lua",
-            ".r": "r",
-            ".R": "r",
-            ".rkt": "racket",
-            ".scm": "scheme",
-            # Config files
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".toml": "toml",
-            ".xml": "xml",
-            ".ini": "ini",
-            # Pascal/Delphi
-            ".pas": "pascal",
-            ".pp": "pascal",
-            ".dpr": "pascal",
-            # Legacy languages
-            ".bas": "basic",
-            ".vb": "basic",
-            ".vbs": "basic",
-            ".f": "fortran",
-            ".f90": "fortran",
-            ".f95": "fortran",
-            ".for": "fortran",
-            ".logo": "logo",
-            # Other
-            ".sql": "sql",
-            ".php": "php",
-            ".pl": "perl",
-            ".swift": "swift",
-            ".kt": "kotlin",
-            ".kts": "kotlin",
-        }
-        return language_map.get(suffix.lower(), "text")
+        return EXTENSION_TO_LANGUAGE.get(suffix.lower(), "text")
 
 
 class BufferManager:
@@ -125,6 +190,14 @@ class BufferManager:
         self._buffers: dict[str, Buffer] = {}
         self._active_buffer_id: str | None = None
         self._buffer_order: list[str] = []
+        # Position of each id in _buffer_order, so tab cycling needn't search
+        self._order_index: dict[str, int] = {}
+        # File path -> id of the buffer showing it, kept in step by set_path()
+        self._path_index: dict[str, str] = {}
+        # Ids of buffers with unsaved changes, kept in step by set_modified()
+        self._modified_ids: set[str] = set()
+        # Untitled buffers created so far; numbers aren't reused after a close
+        self._untitled_count = 0
 
     @property
     def active_buffer(self) -> Buffer | None:
@@ -133,6 +206,11 @@ class BufferManager:
             return self._buffers.get(self._active_buffer_id)
         return None
 
+    @property
+    def modified_count(self) -> int:
+        """Get the number of buffers with unsaved changes."""
+        return len(self._modified_ids)
+
     @property
     def buffer_count(self) -> int:
         """Get the number of open buffers."""
@@ -142,41 +220,69 @@ class BufferManager:
         """Create and add a new buffer."""
         # If name is Untitled, make it unique
         if name == "Untitled":
-            count = sum(1 for b in self._buffers.values() if b.name.startswith("Untitled"))
-            if count > 0:
-                name = f"Untitled-{count + 1}"
+            self._untitled_count += 1
+            if self._untitled_count > 1:
+                name = f"Untitled-{self._untitled_count}"
 
         buffer = Buffer.create_new(name)
-        self._buffers[buffer.id] = buffer
-        self._buffer_order.append(buffer.id)
+        self._add(buffer)
         self._active_buffer_id = buffer.id
         return buffer
 
     def open_file(self, path: str) -> Buffer | None:
         """Open a file into a buffer. Returns existing buffer if already open."""
         # Check if file is already open
-        for buffer in self._buffers.values():
-            if buffer.path == path:
-                self._active_buffer_id = buffer.id
-                return buffer
+        buffer_id = self._path_index.get(path)
+        if buffer_id is not None:
+            buffer = self._buffers[buffer_id]
+            if not buffer.loaded and not self.load_contents(buffer):
+                return None
+            self._active_buffer_id = buffer.id
+            return buffer
 
         try:
             buffer = Buffer.from_file(path)
-            self._buffers[buffer.id] = buffer
-            self._buffer_order.append(buffer.id)
+            self._add(buffer)
             self._active_buffer_id = buffer.id
             return buffer
         except Exception:
             return None
 
+    def add_placeholder(self, path: str) -> Buffer:
+        """Add a buffer for a file without reading it or making it active."""
+        buffer = Buffer.placeholder(path)
+        self._add(buffer)
+        return buffer
+
+    def _add(self, buffer: Buffer) -> None:
+        """Append a buffer to the end of the tab order."""
+        self._buffers[buffer.id] = buffer
+        self._order_index[buffer.id] = len(self._buffer_order)
+        self._buffer_order.append(buffer.id)
+        if buffer.path is not None:
+            self._path_index[buffer.path] = buffer.id
+
+    def load_contents(self, buffer: Buffer) -> bool:
+        """Read a placeholder buffer's file. Returns False if it can't be read."""
+        try:
+            buffer.load()
+        except Exception:
+            return False
+        return True
+
     def close_buffer(self, buffer_id: str) -> bool:
         """Close a buffer. Returns False if buffer has unsaved changes."""
         if buffer_id not in self._buffers:
             return True
 
-        buffer = self._buffers[buffer_id]
-        del self._buffers[buffer_id]
-        self._buffer_order.remove(buffer_id)
+        buffer = self._buffers.pop(buffer_id)
+        self._unindex_path(buffer)
+        idx = self._order_index.pop(buffer_id)
+        del self._buffer_order[idx]
+        # Buffers after the closed one each move up a place
+        for bid in self._buffer_order[idx:]:
+            self._order_index[bid] -= 1
+        self._modified_ids.discard(buffer_id)
 
         # Update active buffer
         if self._active_buffer_id == buffer_id:
@@ -187,6 +293,25 @@ class BufferManager:
 
         return True
 
+    def set_path(self, buffer: Buffer, path: str) -> None:
+        """Point a buffer at a new file path (e.g. after Save As)."""
+        self._unindex_path(buffer)
+        buffer.path = path
+        self._path_index[path] = buffer.id
+
+    def _unindex_path(self, buffer: Buffer) -> None:
+        """Drop a buffer's path from the path index."""
+        if buffer.path is not None and self._path_index.get(buffer.path) == buffer.id:
+            del self._path_index[buffer.path]
+
+    def set_modified(self, buffer: Buffer, modified: bool) -> None:
+        """Set a buffer's modified flag and keep modified_count in step."""
+        buffer.is_modified = modified
+        if modified:
+            self._modified_ids.add(buffer.id)
+        else:
+            self._modified_ids.discard(buffer.id)
+
     def set_active(self, buffer_id: str) -> None:
         """Set the active buffer."""
         if buffer_id in self._buffers:
@@ -198,13 +323,22 @@ class BufferManager:
 
     def get_all_buffers(self) -> list[Buffer]:
         """Get all buffers in order."""
-        return [self._buffers[bid] for bid in self._buffer_order if bid in self._buffers]
+        # _buffers is kept in the same order as _buffer_order (see _add)
+        return list(self._buffers.values())
+
+    def iter_buffers(self) -> Iterable[Buffer]:
+        """Iterate over all buffers in order without copying them into a list.
+
+        Buffers must not be opened or closed while the result is in use.
+        """
+        # _buffers gains and loses keys in step with _buffer_order
+        return self._buffers.values()
 
     def get_next_buffer_id(self) -> str | None:
         """Get the next buffer ID (for Ctrl+Tab)."""
         if not self._buffer_order or not self._active_buffer_id:
             return None
-        idx = self._buffer_order.index(self._active_buffer_id)
+        idx = self._order_index[self._active_buffer_id]
         next_idx = (idx + 1) % len(self._buffer_order)
         return self._buffer_order[next_idx]
 
@@ -212,7 +346,7 @@ class BufferManager:
         """Get the previous buffer ID (for Ctrl+Shift+Tab)."""
         if not self._buffer_order or not self._active_buffer_id:
             return None
-        idx = self._buffer_order.index(self._active_buffer_id)
+        idx = self._order_index[self._active_buffer_id]
         prev_idx = (idx - 1) % len(self._buffer_order)
         return self._buffer_order[prev_idx]
 
@@ -224,8 +358,5 @@ class BufferManager:
 
     def get_buffer_by_path(self, path: str) -> str | None:
         """Get buffer ID by file path. Returns None if not found."""
-        for buffer in self._buffers.values():
-            if buffer.path == str(path):
-                return buffer.id
-        return None
+        return self._path_index.get(str(path))
 
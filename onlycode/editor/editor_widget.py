@@ -1,6 +1,7 @@
-import re
+import os
 from pathlib import Path
 from textual.widgets import TextArea
+from textual.widgets.text_area import Edit, EditResult
 from textual.binding import Binding
 from textual.events import Key
 
@@ -45,12 +46,16 @@ EXTENSION_TO_LANGUAGE = {
     ".sh": "bash",
     ".bash": "bash",
     ".zsh": "bash",
-    ".bashrc": "bash",
-    ".zshrc": "bash",
     # Regex (unlikely but supported)
     ".regex": "regex",
 }
 
+# Whole-name matches for dotfiles, which have no extension
+DOTFILE_TO_LANGUAGE = {
+    ".bashrc": "bash",
+    ".zshrc": "bash",
+}
+
 # Mapping from UI themes to syntax themes
 UI_TO_SYNTAX_THEME = {
     # Exact matches
@@ -91,6 +96,27 @@ class OnlyCodeEditor(TextArea):
         self.theme = "vscode_dark"  # Default syntax theme
         self._user_syntax_theme = None  # User override, if set
         self._auto_indent = True  # Auto-indent on Enter (for code editing)
+        # True when the text may differ from the last copy taken by the owner
+        # (MainScreen keeps a copy on each Buffer). Set synchronously on every
+        # change so it can't lag behind the asynchronous Changed message.
+        self.dirty_since_snapshot = True
+
+    def load_text(self, text: str) -> None:
+        super().load_text(text)
+        self.dirty_since_snapshot = True
+
+    def edit(self, edit: Edit) -> EditResult:
+        result = super().edit(edit)
+        self.dirty_since_snapshot = True
+        return result
+
+    def undo(self) -> None:
+        super().undo()
+        self.dirty_since_snapshot = True
+
+    def redo(self) -> None:
+        super().redo()
+        self.dirty_since_snapshot = True
 
     async def _on_key(self, event: Key) -> None:
         """Handle key events, including auto-indent on Enter."""
@@ -98,9 +124,8 @@ class OnlyCodeEditor(TextArea):
             # Get current line's leading whitespace
             cursor_row = self.cursor_location[0]
             current_line = self.document.get_line(cursor_row)
-            # Extract leading whitespace
-            match = re.match(r'^(\s*)', current_line)
-            indent = match.group(1) if match else ""
+            # Extract leading whitespace (str.lstrip, no regex on each Enter)
+            indent = current_line[:len(current_line) - len(current_line.lstrip())]
             # Insert newline + indent
             self.insert(f"\n{indent}")
             event.prevent_default()
@@ -135,18 +160,19 @@ class OnlyCodeEditor(TextArea):
 
     def detect_language(self, path: str) -> str | None:
         """Detect language from file extension."""
-        p = Path(path)
-        ext = p.suffix.lower()
-        # Also check for dotfiles like .bashrc
-        if not ext and p.name.startswith("."):
-            ext = p.name.lower()
-        return EXTENSION_TO_LANGUAGE.get(ext)
+        # os.path string helpers; no Path object needed just for the suffix
+        name = os.path.basename(path)
+        ext = os.path.splitext(name)[1]
+        if ext:
+            return EXTENSION_TO_LANGUAGE.get(ext.lower())
+        # No extension: check for dotfiles like .bashrc
+        return DOTFILE_TO_LANGUAGE.get(name.lower())
 
     def load_file(self, path: str) -> bool:
         """Load a file into the editor and set language from extension."""
         try:
-            with open(path, "r") as f:
-                self.text = f.read()
+            # Decode the bytes directly: no locale codec, no newline translation
+            self.text = Path(path).read_bytes().decode("utf-8-sig")
             # Auto-detect language from file extension
             self.language = self.detect_language(path)
             return True
@@ -154,11 +180,18 @@ class OnlyCodeEditor(TextArea):
             # TODO: Show error notification
             return False
 
-    def save_file(self, path: str) -> bool:
-        """Save the current content to a file."""
+    def save_file(self, path: str, text: str | None = None, encoding: str = "utf-8") -> bool:
+        """Save the current content (or an already-taken copy of it) to a file.
+
+        Raises UnicodeEncodeError if the text can't be written in encoding;
+        nothing is written in that case.
+        """
+        # Encode once and write the bytes: line endings go out exactly as
+        # the document has them, with no text-layer chunking
+        data = (self.text if text is None else text).encode(encoding)
         try:
-            with open(path, "w") as f:
-                f.write(self.text)
+            with open(path, "wb") as f:
+                f.write(data)
             return True
         except Exception as e:
             return False
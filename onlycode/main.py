@@ -1,4 +1,3 @@
-import sys
 from onlycode.app.application import OnlyCodeApp
 
 def main():
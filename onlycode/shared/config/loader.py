@@ -1,16 +1,54 @@
 # Only Code Editor - Config Loader
 # JSON configuration loading and validation
 
+import codecs
+import copy
+import functools
 import json
 import os
 import sys
 import shutil
-from dataclasses import asdict
+from dataclasses import fields
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 from .settings import Settings, EditorSettings, UISettings, BehaviorSettings, FileBrowserSettings
 
+# Optional faster JSON parser; the stdlib json module is used without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# One encoder for every config write; json.dump(indent=2) builds a new one
+JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def parse_json(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it's installed."""
+    # Both parsers take the raw bytes, so there's no text-mode decode first.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    raw = raw.removeprefix(codecs.BOM_UTF8)
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+@functools.cache
+def get_home_dir() -> Path:
+    """Get the user's home directory, resolved once per process."""
+    return Path.home()
+
+
+@functools.cache
+def get_config_dir() -> Path:
+    """Get the user configuration directory (shared with SessionManager)."""
+    # Use XDG standard: ~/.config/onlycode/
+    config_home = os.environ.get('XDG_CONFIG_HOME')
+    if config_home:
+        return Path(config_home) / 'onlycode'
+    return get_home_dir() / '.config' / 'onlycode'
+
 
 class ConfigLoader:
     """Loads and manages JSON configuration files."""
@@ -19,17 +57,15 @@ class ConfigLoader:
         """Initialize the config loader."""
         self.config_dir = self._get_config_dir()
         self.default_config_dir = self._get_default_config_dir()
+        # Parsed JSON by file path, with the (mtime, size) it was read at
+        self._json_cache: Dict[Path, tuple] = {}
 
         # On first run, copy defaults to user config directory
         self._ensure_user_configs()
 
     def _get_config_dir(self) -> Path:
         """Get the user configuration directory."""
-        # Use XDG standard: ~/.config/onlycode/
-        config_home = os.environ.get('XDG_CONFIG_HOME')
-        if config_home:
-            return Path(config_home) / 'onlycode'
-        return Path.home() / '.config' / 'onlycode'
+        return get_config_dir()
 
     def _get_default_config_dir(self) -> Path:
         """Get the default configuration directory (bundled with app)."""
@@ -58,18 +94,31 @@ class ConfigLoader:
             'languages.json',
         ]
 
+        # List each directory once rather than stat()ing every file in both
+        user_present = self._list_dir(self.config_dir)
+        default_present = self._list_dir(self.default_config_dir)
+
         for filename in config_files:
             user_file = self.config_dir / filename
             default_file = self.default_config_dir / filename
 
             # Copy default to user dir if user file doesn't exist
-            if not user_file.exists() and default_file.exists():
+            if filename not in user_present and filename in default_present:
                 # For settings.json, sanitize paths before copying
                 if filename == 'settings.json':
                     self._copy_sanitized_settings(default_file, user_file)
                 else:
                     shutil.copy2(default_file, user_file)
 
+    @staticmethod
+    def _list_dir(directory: Path) -> set:
+        """Get the names in a directory, or an empty set if it can't be read."""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+
     def _copy_sanitized_settings(self, src: Path, dst: Path):
         """Copy settings.json with sanitized paths for new users."""
         try:
@@ -78,8 +127,9 @@ class ConfigLoader:
 
             # Reset paths to sensible defaults for new users
             if 'file_browser' in data:
-                data['file_browser']['default_directory'] = str(Path.home())
-                data['file_browser']['bookmarks'] = [str(Path.home())]
+                home = str(get_home_dir())
+                data['file_browser']['default_directory'] = home
+                data['file_browser']['bookmarks'] = [home]
 
             with open(dst, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
@@ -92,13 +142,14 @@ class ConfigLoader:
         Load a JSON config file.
         
         Tries user config first, falls back to default config.
+        The result is cached and shared between calls: copy anything
+        handed on to callers that might modify it.
         """
         # Try user config first
         user_file = self.config_dir / filename
         if user_file.exists():
             try:
-                with open(user_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._read_json(user_file)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Failed to load user config {filename}: {e}")
                 # Fall through to default
@@ -106,15 +157,26 @@ class ConfigLoader:
         # Fall back to default config
         default_file = self.default_config_dir / filename
         if default_file.exists():
-            with open(default_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self._read_json(default_file)
         
         # Return empty dict if neither exists
         return {}
+
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        """Parse a JSON file, reusing the last parse if it hasn't changed."""
+        st = path.stat()
+        # Size as well as mtime, for filesystems with coarse timestamps
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = parse_json(path.read_bytes())
+        self._json_cache[path] = (stamp, data)
+        return data
     
     def load_settings(self) -> Settings:
         """Load application settings from settings.json."""
-        data = self._load_json('settings.json')
+        data = copy.deepcopy(self._load_json('settings.json'))
 
         # Extract nested settings with defaults
         editor_data = data.get('editor', {})
@@ -133,22 +195,22 @@ class ConfigLoader:
         """Load a UI theme by name."""
         data = self._load_json('ui-themes.json')
         themes = data.get('themes', {})
-        return themes.get(theme_name, themes.get('default-dark', {}))
+        return copy.deepcopy(themes.get(theme_name, themes.get('default-dark', {})))
     
     def load_syntax_theme(self, theme_name: str) -> Dict[str, str]:
         """Load a syntax theme by name."""
         data = self._load_json('syntax-themes.json')
         themes = data.get('themes', {})
-        return themes.get(theme_name, themes.get('default', {}))
+        return copy.deepcopy(themes.get(theme_name, themes.get('default', {})))
     
     def load_keybindings(self) -> Dict[str, str]:
         """Load keyboard shortcuts."""
-        return self._load_json('keybindings.json')
+        return copy.deepcopy(self._load_json('keybindings.json'))
     
     def load_language_config(self, language: str) -> Dict[str, Any]:
         """Load language-specific configuration."""
         data = self._load_json('languages.json')
-        return data.get(language, {})
+        return copy.deepcopy(data.get(language, {}))
     
     def ensure_config_dir(self):
         """Ensure the user config directory exists."""
@@ -186,6 +248,12 @@ class ConfigLoader:
         themes = data.get('themes', {})
         return list(themes.keys())
 
+    @staticmethod
+    def _shallow_dict(obj) -> Dict[str, Any]:
+        """Get a settings dataclass's fields as a dict, without copying values."""
+        # asdict() deep-copies; the dict is only serialized, so it needn't
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
     def save_settings(self, settings: Settings):
         """
         Save settings to settings.json.
@@ -195,17 +263,23 @@ class ConfigLoader:
         """
         # Convert settings to dict
         data = {
-            'editor': asdict(settings.editor),
-            'ui': asdict(settings.ui),
-            'behavior': asdict(settings.behavior),
-            'file_browser': asdict(settings.file_browser)
+            'editor': self._shallow_dict(settings.editor),
+            'ui': self._shallow_dict(settings.ui),
+            'behavior': self._shallow_dict(settings.behavior),
+            'file_browser': self._shallow_dict(settings.file_browser)
         }
 
         # Save to default config location (for now)
         settings_file = self.default_config_dir / 'settings.json'
 
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Serialize first and write once; json.dump writes piece by piece
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = JSON_ENCODER.encode(data).encode('utf-8')
+        with open(settings_file, 'wb') as f:
+            f.write(payload)
+        self._json_cache.pop(settings_file, None)
 
     def get_config_file_path(self, filename: str) -> Path:
         """
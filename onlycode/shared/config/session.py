@@ -1,20 +1,54 @@
 # Only Code Editor - Session Management
 # Save and restore open files between sessions
 
-import json
+import os
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass, asdict
+from typing import Iterable, List, Optional, Set
+from dataclasses import dataclass
 
+from .loader import JSON_ENCODER, get_config_dir, parse_json
 
-@dataclass
+
+# Session directories already created by this process
+_created_dirs: Set[Path] = set()
+
+
+def existing_files(paths: Iterable[str]) -> Set[str]:
+    """
+    Return the subset of paths that are existing files.
+
+    Paths are grouped by directory and each directory is listed once with
+    os.scandir, instead of stat()ing every path individually.
+    """
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    found = set()
+    for directory, dir_paths in by_dir.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                files = {e.name for e in entries if e.is_file()}
+        except OSError:
+            # Unreadable/missing directory: fall back to per-path checks
+            found.update(p for p in dir_paths if os.path.isfile(p))
+            continue
+        found.update(p for p in dir_paths if os.path.basename(p) in files)
+    return found
+
+
+@dataclass(slots=True)
 class SessionData:
     """Data stored in session file."""
     open_files: List[str]  # List of file paths
     active_tab_index: int = 0
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Plain fields, so no need for asdict()'s recursive copy
+        return {
+            'open_files': self.open_files,
+            'active_tab_index': self.active_tab_index,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'SessionData':
@@ -33,9 +67,11 @@ class SessionManager:
     
     def _get_session_file_path(self) -> Path:
         """Get the session file path."""
-        # Use XDG_CONFIG_HOME or default to ~/.config
-        config_home = Path.home() / ".config" / "onlycode"
-        config_home.mkdir(parents=True, exist_ok=True)
+        # Same directory as ConfigLoader (XDG_CONFIG_HOME or ~/.config)
+        config_home = get_config_dir()
+        if config_home not in _created_dirs:
+            config_home.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(config_home)
         return config_home / "session.json"
     
     def save_session(self, open_files: List[Path], active_tab_index: int = 0):
@@ -46,11 +82,11 @@ class SessionManager:
             open_files: List of open file paths
             active_tab_index: Index of the currently active tab
         """
-        # Convert paths to strings, only save files that exist
-        file_paths = []
-        for f in open_files:
-            if f and f.exists():
-                file_paths.append(str(f))
+        # Convert paths to strings, only save files that exist (checked with
+        # one directory listing per parent rather than a stat per file)
+        file_paths = [str(f) for f in open_files if f]
+        present = existing_files(file_paths)
+        file_paths = [f for f in file_paths if f in present]
         
         session = SessionData(
             open_files=file_paths,
@@ -58,8 +94,9 @@ class SessionManager:
         )
         
         try:
-            with open(self._session_file, 'w', encoding='utf-8') as f:
-                json.dump(session.to_dict(), f, indent=2)
+            payload = JSON_ENCODER.encode(session.to_dict()).encode('utf-8')
+            with open(self._session_file, 'wb') as f:
+                f.write(payload)
         except Exception as e:
             print(f"Warning: Could not save session: {e}")
     
@@ -70,13 +107,14 @@ class SessionManager:
         Returns:
             SessionData if file exists and is valid, None otherwise
         """
-        if not self._session_file.exists():
-            return None
-        
+        # Open directly rather than stat()ing first; a missing file is the
+        # common "no session yet" case
         try:
-            with open(self._session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self._session_file, 'rb') as f:
+                data = parse_json(f.read())
             return SessionData.from_dict(data)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Warning: Could not load session: {e}")
             return None
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class EditorSettings:
     """Editor behavior settings."""
     font_family: str = "JetBrains Mono"
@@ -18,7 +18,7 @@ class EditorSettings:
     auto_indent: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class FileBrowserSettings:
     """File browser settings."""
     font_size: int = 11
@@ -30,7 +30,7 @@ class FileBrowserSettings:
             self.bookmarks = []
 
 
-@dataclass
+@dataclass(slots=True)
 class UISettings:
     """UI appearance and behavior settings."""
     theme: str = "default-dark"
@@ -40,13 +40,13 @@ class UISettings:
     hover_edge_threshold_px: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class BehaviorSettings:
     """Application behavior settings."""
     remember_open_files: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Complete application settings."""
     editor: EditorSettings
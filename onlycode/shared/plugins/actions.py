@@ -1,18 +1,104 @@
 # Only Code Editor - Plugin Actions
 # Built-in action implementations
 
+import asyncio
+import os
+import signal
 import subprocess
 import re
-from typing import Dict, Any, Optional, Callable
+from datetime import datetime
+from typing import Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
 
 from .models import Action, ActionType
 from .scripting import EditorAPI, LuaEngine, PythonEngine, LUPA_AVAILABLE
 
+# ${name} or $name in a snippet template
+SNIPPET_VAR_RE = re.compile(r'\$\{(\w+)\}|\$(\w+)')
+
+# Whitespace (other than the newline itself) at the end of each line
+TRAILING_WHITESPACE_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+
+# Formats for the snippet 'date' and 'datetime' variable sources
+DATE_FORMAT = '%Y-%m-%d'
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# External command 'output' settings that write stdout into the editor buffer
+BUFFER_OUTPUT_TYPES = frozenset({'replace_file_contents', 'replace_selection', 'insert'})
+
+# External command 'output' settings that use stdout; others discard it
+CAPTURED_OUTPUT_TYPES = BUFFER_OUTPUT_TYPES | {'notify'}
+
+# Seconds an external command may run before it is stopped
+COMMAND_TIMEOUT = 30
+# Seconds a stopped command gets to exit on SIGTERM before it is killed
+COMMAND_KILL_GRACE = 2
+
+
+def action_edits_buffer(action: Action) -> bool:
+    """Whether running an action may change the editor's text."""
+    if action.type == ActionType.NOTIFY:
+        return False
+    if action.type == ActionType.EXTERNAL_COMMAND:
+        return action.config.get('output', 'none') in BUFFER_OUTPUT_TYPES
+    if action.type == ActionType.CHAIN:
+        # Steps that didn't build at load time are only known when run
+        steps = action.chain_steps
+        return steps is None or any(action_edits_buffer(step) for step in steps)
+    # Snippets and transforms edit the text, and a script may
+    return True
+
+
+def truncate_middle(text: str, limit: int) -> str:
+    """Shorten text to about limit characters, keeping its start and end."""
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return text[:half] + '\n…\n' + text[-half:]
+
+
+def _sort_lines(text: str) -> str:
+    """Sort lines alphabetically."""
+    return '\n'.join(sorted(text.split('\n')))
+
+
+def _reverse_lines(text: str) -> str:
+    """Reverse the order of lines."""
+    return '\n'.join(reversed(text.split('\n')))
+
+
+def _unique_lines(text: str) -> str:
+    """Drop repeated lines, keeping the first of each."""
+    # dict keys keep first-seen order and drop repeats in one C pass
+    return '\n'.join(dict.fromkeys(text.split('\n')))
+
+
+def _trim_whitespace(text: str) -> str:
+    """Strip trailing whitespace from every line."""
+    # Same as rstrip() on each line, without building a list of lines
+    return TRAILING_WHITESPACE_RE.sub('', text)
+
+
+def _remove_blank_lines(text: str) -> str:
+    """Drop lines that are empty or only whitespace."""
+    return '\n'.join(line for line in text.split('\n') if line.strip())
+
 
 class ActionExecutor:
     """Executes plugin actions."""
 
+    # Text transformations by name (the 'transform' action's config value)
+    TRANSFORMS: Dict[str, Callable[[str], str]] = {
+        'uppercase': str.upper,
+        'lowercase': str.lower,
+        'titlecase': str.title,
+        'sort_lines': _sort_lines,
+        'reverse_lines': _reverse_lines,
+        'unique_lines': _unique_lines,
+        'trim_whitespace': _trim_whitespace,
+        'remove_blank_lines': _remove_blank_lines,
+    }
+
     def __init__(self):
         """Initialize the action executor."""
         self._notify_callback: Optional[Callable[[str, str], None]] = None
@@ -26,6 +112,19 @@ class ActionExecutor:
         self._get_file_path: Optional[Callable[[], Optional[Path]]] = None
         self._get_language: Optional[Callable[[], str]] = None
         self._plugin_base_path: Optional[Path] = None  # Set per-plugin execution
+        # Built on first script run; set_callbacks() drops it and the engines
+        self._editor_api: Optional[EditorAPI] = None
+        # Script engines reused across runs, by (plugin path, engine type)
+        self._engine_cache: Dict[Tuple[Optional[Path], str], Any] = {}
+        # Handler for each action type, looked up once per execute()
+        self._handlers: Dict[ActionType, Callable[[Action, Dict[str, Any]], bool]] = {
+            ActionType.EXTERNAL_COMMAND: self._execute_external_command,
+            ActionType.SNIPPET: self._execute_snippet,
+            ActionType.TRANSFORM: self._execute_transform,
+            ActionType.NOTIFY: self._execute_notify,
+            ActionType.CHAIN: self._execute_chain,
+            ActionType.SCRIPT: self._execute_script,
+        }
 
     def set_callbacks(self,
                       notify: Callable[[str, str], None] = None,
@@ -59,6 +158,9 @@ class ActionExecutor:
             self._get_file_path = get_file_path
         if get_language:
             self._get_language = get_language
+        # Scripts must see the new callbacks
+        self._editor_api = None
+        self._engine_cache.clear()
 
     def set_plugin_base_path(self, path: Path):
         """Set the base path for the current plugin (for resolving script paths)."""
@@ -68,6 +170,30 @@ class ActionExecutor:
         """
         Execute an action.
 
+        Args:
+            action: The action to execute
+            context: Execution context (may contain editor, file_path, etc.)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        handler = self._handlers.get(action.type)
+        if handler is None:
+            self._notify("Plugin Error", f"Unknown action type: {action.type}")
+            return False
+        try:
+            return handler(action, context)
+        except Exception as e:
+            self._notify("Plugin Error", f"Action failed: {e}")
+            return False
+
+    async def execute_async(self, action: Action, context: Dict[str, Any]) -> bool:
+        """
+        Execute an action without blocking the event loop.
+
+        External commands (including those inside chains) run as asyncio
+        subprocesses; other action types are quick and run as in execute().
+
         Args:
             action: The action to execute
             context: Execution context (may contain editor, file_path, etc.)
@@ -77,23 +203,13 @@ class ActionExecutor:
         """
         try:
             if action.type == ActionType.EXTERNAL_COMMAND:
-                return self._execute_external_command(action, context)
-            elif action.type == ActionType.SNIPPET:
-                return self._execute_snippet(action, context)
-            elif action.type == ActionType.TRANSFORM:
-                return self._execute_transform(action, context)
-            elif action.type == ActionType.NOTIFY:
-                return self._execute_notify(action, context)
+                return await self._execute_external_command_async(action, context)
             elif action.type == ActionType.CHAIN:
-                return self._execute_chain(action, context)
-            elif action.type == ActionType.SCRIPT:
-                return self._execute_script(action, context)
-            else:
-                self._notify("Plugin Error", f"Unknown action type: {action.type}")
-                return False
+                return await self._execute_chain_async(action, context)
         except Exception as e:
             self._notify("Plugin Error", f"Action failed: {e}")
             return False
+        return self.execute(action, context)
 
     def _notify(self, title: str, message: str):
         """Show a notification."""
@@ -112,11 +228,99 @@ class ActionExecutor:
             output: "replace_file_contents" | "replace_selection" | "insert" | "notify" | "none"
             working_dir: Optional working directory
         """
+        prepared = self._prepare_command(action)
+        if prepared is None:
+            return False
+        command, encoded, cwd, output_type = prepared
+
+        # Run command
+        try:
+            process = subprocess.Popen(
+                command,
+                shell=True,
+                stdin=subprocess.PIPE if encoded is not None else subprocess.DEVNULL,
+                # Unused output is discarded by the OS rather than buffered here
+                stdout=subprocess.PIPE if output_type in CAPTURED_OUTPUT_TYPES else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                # Own process group, so a timeout kills whatever the shell started
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = process.communicate(encoded, timeout=COMMAND_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                # Stopping only the shell would leave its children running and
+                # holding the pipes open, so the whole group is signalled
+                self._signal_command(process, signal.SIGTERM)
+                try:
+                    process.wait(timeout=COMMAND_KILL_GRACE)
+                except subprocess.TimeoutExpired:
+                    pass
+                self._signal_command(process, getattr(signal, 'SIGKILL', signal.SIGTERM))
+                process.communicate()
+                raise
+
+            return self._handle_command_result(process.returncode, stdout, stderr, output_type)
+
+        except subprocess.TimeoutExpired:
+            self._notify("Command Timeout", "Command took too long to execute")
+            return False
+        except Exception as e:
+            self._notify("Command Error", str(e))
+            return False
+
+    async def _execute_external_command_async(self, action: Action, context: Dict[str, Any]) -> bool:
+        """Execute an external shell command without blocking the event loop."""
+        prepared = self._prepare_command(action)
+        if prepared is None:
+            return False
+        command, encoded, cwd, output_type = prepared
+
+        try:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdin=asyncio.subprocess.PIPE if encoded is not None else asyncio.subprocess.DEVNULL,
+                stdout=(asyncio.subprocess.PIPE if output_type in CAPTURED_OUTPUT_TYPES
+                        else asyncio.subprocess.DEVNULL),
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(encoded), timeout=COMMAND_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                self._signal_command(process, signal.SIGTERM)
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=COMMAND_KILL_GRACE)
+                except asyncio.TimeoutError:
+                    pass
+                self._signal_command(process, getattr(signal, 'SIGKILL', signal.SIGTERM))
+                # Drain to EOF so the pipes are closed before returning
+                await process.communicate()
+                self._notify("Command Timeout", "Command took too long to execute")
+                return False
+
+            return self._handle_command_result(process.returncode, stdout, stderr, output_type)
+
+        except Exception as e:
+            self._notify("Command Error", str(e))
+            return False
+
+    def _prepare_command(self, action: Action) -> Optional[tuple]:
+        """
+        Work out an external command's settings from its config.
+
+        Returns:
+            (command, encoded stdin or None, cwd, output type), or None if
+            the action has no command
+        """
         config = action.config
         command = config.get('command')
         if not command:
             self._notify("Plugin Error", "No command specified")
-            return False
+            return None
 
         input_type = config.get('input', 'none')
         output_type = config.get('output', 'none')
@@ -128,6 +332,9 @@ class ActionExecutor:
             stdin_data = self._get_editor_text()
         elif input_type == 'selection' and self._get_selection:
             stdin_data = self._get_selection()
+        # Encode the input once and pipe the bytes; text=True would wrap
+        # the pipes in text layers that re-encode and re-decode
+        encoded = stdin_data.encode('utf-8') if stdin_data is not None else None
 
         # Determine working directory
         cwd = None
@@ -138,43 +345,51 @@ class ActionExecutor:
             if file_path:
                 cwd = str(file_path.parent)
 
-        # Run command
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                input=stdin_data,
-                cwd=cwd,
-                timeout=30  # 30 second timeout
-            )
+        return command, encoded, cwd, output_type
 
-            if result.returncode != 0:
-                error_msg = result.stderr or f"Command exited with code {result.returncode}"
-                self._notify("Command Failed", error_msg[:200])
-                return False
+    def _handle_command_result(self, returncode: int, stdout: Optional[bytes],
+                               stderr: bytes, output_type: str) -> bool:
+        """Report a finished command's failure or deliver its output."""
+        if returncode != 0:
+            # Only the first 200 characters are shown; 1 KiB of UTF-8 covers them
+            error_msg = (self._decode_output(stderr[:1024])
+                         or f"Command exited with code {returncode}")
+            self._notify("Command Failed", error_msg[:200])
+            return False
 
-            output = result.stdout
+        # Handle output, decoding it only for a sink that will use it
+        if output_type == 'notify':
+            self._notify("Command Output", truncate_middle(self._decode_output(stdout), 500))
+            return True
+        sink = {
+            'replace_file_contents': self._set_editor_text,
+            'replace_selection': self._replace_selection,
+            'insert': self._insert_text,
+        }.get(output_type)
+        if sink:
+            sink(self._decode_output(stdout))
 
-            # Handle output
-            if output_type == 'replace_file_contents' and self._set_editor_text:
-                self._set_editor_text(output)
-            elif output_type == 'replace_selection' and self._replace_selection:
-                self._replace_selection(output)
-            elif output_type == 'insert' and self._insert_text:
-                self._insert_text(output)
-            elif output_type == 'notify':
-                self._notify("Command Output", output[:500])
+        return True
 
-            return True
+    @staticmethod
+    def _signal_command(process, sig: int) -> None:
+        """Send a signal to a command's process group (the process alone on Windows)."""
+        try:
+            if hasattr(os, 'killpg'):
+                # The group outlives the shell, so this also reaches children
+                # that are still running after the shell itself has exited
+                os.killpg(process.pid, sig)
+            elif sig == signal.SIGTERM:
+                process.terminate()
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
 
-        except subprocess.TimeoutExpired:
-            self._notify("Command Timeout", "Command took too long to execute")
-            return False
-        except Exception as e:
-            self._notify("Command Error", str(e))
-            return False
+    @staticmethod
+    def _decode_output(data: bytes) -> str:
+        """Decode command output, with newlines translated as text mode did."""
+        return data.decode('utf-8', errors='replace').replace('\r\n', '\n')
 
     def _execute_snippet(self, action: Action, context: Dict[str, Any]) -> bool:
         """
@@ -188,7 +403,8 @@ class ActionExecutor:
         template = config.get('template', '')
         variables = config.get('variables', {})
 
-        # Build variable values
+        # Build variable values (one clock reading, so date and datetime agree)
+        now = None
         var_values = {}
         for var_name, var_source in variables.items():
             if var_source == 'selection' and self._get_selection:
@@ -199,21 +415,20 @@ class ActionExecutor:
             elif var_source == 'file_path' and self._get_file_path:
                 file_path = self._get_file_path()
                 var_values[var_name] = str(file_path) if file_path else ''
-            elif var_source == 'date':
-                from datetime import datetime
-                var_values[var_name] = datetime.now().strftime('%Y-%m-%d')
-            elif var_source == 'datetime':
-                from datetime import datetime
-                var_values[var_name] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            elif var_source in ('date', 'datetime'):
+                if now is None:
+                    now = datetime.now()
+                var_values[var_name] = now.strftime(
+                    DATE_FORMAT if var_source == 'date' else DATETIME_FORMAT)
             else:
                 # Use as literal value
                 var_values[var_name] = str(var_source)
 
-        # Substitute variables in template
-        result = template
-        for var_name, var_value in var_values.items():
-            result = result.replace(f'${{{var_name}}}', var_value)
-            result = result.replace(f'${var_name}', var_value)
+        # Substitute variables in one pass; unknown names are left as written
+        result = SNIPPET_VAR_RE.sub(
+            lambda m: var_values.get(m.group(1) or m.group(2), m.group(0)),
+            template
+        )
 
         # Insert the result
         if self._insert_text:
@@ -262,36 +477,11 @@ class ActionExecutor:
 
     def _apply_transform(self, text: str, transform: str) -> Optional[str]:
         """Apply a specific transformation to text."""
-        if transform == 'uppercase':
-            return text.upper()
-        elif transform == 'lowercase':
-            return text.lower()
-        elif transform == 'titlecase':
-            return text.title()
-        elif transform == 'sort_lines':
-            lines = text.split('\n')
-            return '\n'.join(sorted(lines))
-        elif transform == 'reverse_lines':
-            lines = text.split('\n')
-            return '\n'.join(reversed(lines))
-        elif transform == 'unique_lines':
-            lines = text.split('\n')
-            seen = set()
-            unique = []
-            for line in lines:
-                if line not in seen:
-                    seen.add(line)
-                    unique.append(line)
-            return '\n'.join(unique)
-        elif transform == 'trim_whitespace':
-            lines = text.split('\n')
-            return '\n'.join(line.rstrip() for line in lines)
-        elif transform == 'remove_blank_lines':
-            lines = text.split('\n')
-            return '\n'.join(line for line in lines if line.strip())
-        else:
+        func = self.TRANSFORMS.get(transform)
+        if func is None:
             self._notify("Transform Error", f"Unknown transform: {transform}")
             return None
+        return func(text)
 
     def _execute_notify(self, action: Action, context: Dict[str, Any]) -> bool:
         """
@@ -318,17 +508,33 @@ class ActionExecutor:
         config = action.config
         actions_list = config.get('actions', [])
 
+        steps = action.chain_steps
         for i, action_config in enumerate(actions_list):
             try:
-                # Create a temporary action from config
-                action_type = ActionType(action_config.get('type'))
-                temp_action = Action(
-                    id=f"{action.id}_chain_{i}",
-                    type=action_type,
-                    config={k: v for k, v in action_config.items() if k != 'type'}
-                )
+                step = steps[i] if steps is not None else self._chain_step(action, i, action_config)
+                if not self.execute(step, context):
+                    return False
+
+            except Exception as e:
+                self._notify("Chain Error", f"Action {i} failed: {e}")
+                return False
+
+        return True
+
+    async def _execute_chain_async(self, action: Action, context: Dict[str, Any]) -> bool:
+        """Execute a chain's actions in sequence, awaiting external commands."""
+        config = action.config
+        actions_list = config.get('actions', [])
+        # Other actions may run (and set their own plugin's path) while a
+        # step is awaited, so restore this chain's path before each step
+        base_path = self._plugin_base_path
 
-                if not self.execute(temp_action, context):
+        steps = action.chain_steps
+        for i, action_config in enumerate(actions_list):
+            self._plugin_base_path = base_path
+            try:
+                step = steps[i] if steps is not None else self._chain_step(action, i, action_config)
+                if not await self.execute_async(step, context):
                     return False
 
             except Exception as e:
@@ -337,6 +543,15 @@ class ActionExecutor:
 
         return True
 
+    @staticmethod
+    def _chain_step(action: Action, index: int, action_config: Dict[str, Any]) -> Action:
+        """Create a temporary action from one entry of a chain's config."""
+        return Action(
+            id=f"{action.id}_chain_{index}",
+            type=ActionType(action_config.get('type')),
+            config={k: v for k, v in action_config.items() if k != 'type'}
+        )
+
     def _execute_script(self, action: Action, context: Dict[str, Any]) -> bool:
         """
         Execute a Lua or Python script.
@@ -353,31 +568,14 @@ class ActionExecutor:
         entry_point = config.get('entry_point')
         inline_code = config.get('code')
 
-        # Create EditorAPI instance
-        editor_api = EditorAPI(
-            get_text=self._get_editor_text,
-            set_text=self._set_editor_text,
-            get_selection=self._get_selection,
-            replace_selection=self._replace_selection,
-            insert_text=self._insert_text,
-            get_cursor_position=self._get_cursor_position,
-            set_cursor_position=self._set_cursor_position,
-            get_file_path=self._get_file_path,
-            get_language=self._get_language,
-            show_notification=self._notify_callback,
-        )
-
-        # Create appropriate engine
-        if engine_type == 'lua':
-            if not LUPA_AVAILABLE:
-                self._notify("Script Error", "Lua engine not available. Install lupa: pip install lupa")
-                return False
-            engine = LuaEngine(editor_api)
-        elif engine_type == 'python':
-            engine = PythonEngine(editor_api)
-        else:
+        # Get (or create) the engine for this plugin
+        if engine_type not in ('lua', 'python'):
             self._notify("Script Error", f"Unknown script engine: {engine_type}")
             return False
+        if engine_type == 'lua' and not LUPA_AVAILABLE:
+            self._notify("Script Error", "Lua engine not available. Install lupa: pip install lupa")
+            return False
+        engine = self._get_engine(engine_type)
 
         # Execute script
         if script_file:
@@ -400,3 +598,26 @@ class ActionExecutor:
             return False
 
         return True
+
+    def _get_engine(self, engine_type: str):
+        """Get the current plugin's engine of a type, creating it on first use."""
+        key = (self._plugin_base_path, engine_type)
+        engine = self._engine_cache.get(key)
+        if engine is None:
+            if self._editor_api is None:
+                self._editor_api = EditorAPI(
+                    get_text=self._get_editor_text,
+                    set_text=self._set_editor_text,
+                    get_selection=self._get_selection,
+                    replace_selection=self._replace_selection,
+                    insert_text=self._insert_text,
+                    get_cursor_position=self._get_cursor_position,
+                    set_cursor_position=self._set_cursor_position,
+                    get_file_path=self._get_file_path,
+                    get_language=self._get_language,
+                    show_notification=self._notify_callback,
+                )
+            engine_class = LuaEngine if engine_type == 'lua' else PythonEngine
+            engine = engine_class(self._editor_api)
+            self._engine_cache[key] = engine
+        return engine
@@ -1,10 +1,14 @@
 # Only Code Editor - Plugin Loader
 # Plugin discovery and loading
 
+import asyncio
 import json
+import os
 from pathlib import Path
 from typing import List, Dict, Optional, Callable, Any
 
+from ..config.loader import parse_json
+from .actions import action_edits_buffer
 from .models import Plugin, Trigger, Action, TriggerType
 
 
@@ -41,14 +45,17 @@ class PluginManager:
         """
         self._plugins.clear()
 
-        if not self._plugins_dir.exists():
+        # scandir entries know whether they are directories without a stat each
+        try:
+            with os.scandir(self._plugins_dir) as entries:
+                plugin_dirs = [Path(e.path) for e in entries if e.is_dir()]
+        except FileNotFoundError:
             return []
 
-        for plugin_dir in self._plugins_dir.iterdir():
-            if plugin_dir.is_dir():
-                plugin = self._load_plugin(plugin_dir)
-                if plugin:
-                    self._plugins[plugin.name] = plugin
+        for plugin_dir in plugin_dirs:
+            plugin = self._load_plugin(plugin_dir)
+            if plugin:
+                self._plugins[plugin.name] = plugin
 
         return list(self._plugins.values())
 
@@ -64,16 +71,18 @@ class PluginManager:
         """
         plugin_json = plugin_dir / "plugin.json"
 
-        if not plugin_json.exists():
-            return None
-
         try:
-            with open(plugin_json, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Bytes straight to the parser (orjson when installed); its
+            # decode errors subclass json.JSONDecodeError
+            with open(plugin_json, 'rb') as f:
+                data = parse_json(f.read())
 
             plugin = Plugin.from_dict(data, plugin_dir)
             return plugin
 
+        except FileNotFoundError:
+            # Not a plugin directory (opened directly rather than stat()ed first)
+            return None
         except json.JSONDecodeError as e:
             # Return plugin with error
             return Plugin(
@@ -147,8 +156,8 @@ class PluginManager:
         if not trigger:
             return False
 
-        # Get the action
-        action = plugin.get_action(trigger.action_id)
+        # Get the action (resolved when the plugin was loaded)
+        action = trigger.action
         if not action:
             return False
 
@@ -160,36 +169,72 @@ class PluginManager:
 
         return False
 
-    def on_file_save(self, file_path: Path, language: Optional[str], context: Dict[str, Any]):
+    async def on_file_save(self, file_path: Path, language: Optional[str], context: Dict[str, Any]):
         """
         Handle file save event - execute on_save triggers.
 
+        Matching actions run through ActionExecutor.execute_async, so none
+        blocks the caller's event loop. Actions that only read the buffer
+        (e.g. a linter with 'notify' output) overlap; one that may edit it
+        runs alone, in trigger order, and sees the previous edits.
+
         Args:
             file_path: Path of saved file
             language: Detected language/file type
             context: Execution context
         """
-        for plugin in self.get_enabled_plugins():
-            for trigger in plugin.get_on_save_triggers():
-                if trigger.context.matches(language, file_path):
-                    action = plugin.get_action(trigger.action_id)
-                    if action and self._action_executor:
-                        self._action_executor.set_plugin_base_path(plugin.path)
-                        self._action_executor.execute(action, context)
-
-    def on_file_open(self, file_path: Path, language: Optional[str], context: Dict[str, Any]):
+        await self._run_event_triggers(Plugin.get_on_save_triggers, file_path, language, context)
+
+    async def on_file_open(self, file_path: Path, language: Optional[str], context: Dict[str, Any]):
         """
-        Handle file open event - execute on_open triggers.
+        Handle file open event - execute on_open triggers (scheduled as in
+        on_file_save).
 
         Args:
             file_path: Path of opened file
             language: Detected language/file type
             context: Execution context
         """
+        await self._run_event_triggers(Plugin.get_on_open_triggers, file_path, language, context)
+
+    async def _run_event_triggers(self, get_triggers: Callable[[Plugin], List[Trigger]],
+                                  file_path: Path, language: Optional[str],
+                                  context: Dict[str, Any]):
+        """Run every enabled plugin's matching event triggers, in order.
+
+        Consecutive actions that can't change the buffer run together. An
+        action that may edit it waits for everything before it and runs
+        alone, since it reads the editor text and writes its result back.
+        """
+        if not self._action_executor:
+            return
+        # Normalize once for every trigger's context check
+        language = language.lower() if language else None
+        file_name = os.path.normcase(file_path.name) if file_path else None
+        batch = []
         for plugin in self.get_enabled_plugins():
-            for trigger in plugin.get_on_open_triggers():
-                if trigger.context.matches(language, file_path):
-                    action = plugin.get_action(trigger.action_id)
-                    if action and self._action_executor:
-                        self._action_executor.set_plugin_base_path(plugin.path)
-                        self._action_executor.execute(action, context)
+            # Only triggers with a resolved action are listed here
+            for trigger in get_triggers(plugin):
+                if not trigger.context.matches_normalized(language, file_name):
+                    continue
+                run = self._run_plugin_action(plugin, trigger.action, context)
+                if action_edits_buffer(trigger.action):
+                    await self._gather_runs(batch)
+                    batch = []
+                    await self._gather_runs([run])
+                else:
+                    batch.append(run)
+        await self._gather_runs(batch)
+
+    @staticmethod
+    async def _gather_runs(runs: List[Any]) -> None:
+        """Await plugin action runs together."""
+        if runs:
+            # Failures are reported by the executor; one mustn't cancel the rest
+            await asyncio.gather(*runs, return_exceptions=True)
+
+    async def _run_plugin_action(self, plugin: Plugin, action: Action, context: Dict[str, Any]) -> bool:
+        """Execute one plugin's action with that plugin's base path set."""
+        # Set in the same step that starts the action; see _execute_chain_async
+        self._action_executor.set_plugin_base_path(plugin.path)
+        return await self._action_executor.execute_async(action, context)
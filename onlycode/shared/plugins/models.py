@@ -1,8 +1,11 @@
 # Only Code Editor - Plugin Models
 # Data structures for plugins, triggers, and actions
 
+import fnmatch
+import os
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Pattern, FrozenSet
 from enum import Enum
 from pathlib import Path
 
@@ -30,6 +33,17 @@ class TriggerContext:
     """Context conditions for when a trigger should be active."""
     languages: List[str] = field(default_factory=list)  # File extensions/languages
     file_patterns: List[str] = field(default_factory=list)  # Glob patterns
+    # Derived from the fields above once, so matches() doesn't redo it per event
+    _language_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _compiled_patterns: List[Pattern] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._language_set = frozenset(lang.lower() for lang in self.languages)
+        # Same translation fnmatch.fnmatch() does (normcase included), done once
+        self._compiled_patterns = [
+            re.compile(fnmatch.translate(os.path.normcase(pattern)))
+            for pattern in self.file_patterns
+        ]
     
     @classmethod
     def from_dict(cls, data: Optional[Dict]) -> 'TriggerContext':
@@ -42,27 +56,34 @@ class TriggerContext:
     
     def matches(self, language: Optional[str] = None, file_path: Optional[Path] = None) -> bool:
         """Check if context matches current conditions."""
+        return self.matches_normalized(
+            language.lower() if language else None,
+            os.path.normcase(file_path.name) if file_path else None,
+        )
+    
+    def matches_normalized(self, language: Optional[str], file_name: Optional[str]) -> bool:
+        """
+        Check the context against an already-lowercased language and an
+        os.path.normcase()d file name, so a caller testing many triggers
+        against one file can normalize them once.
+        """
         # If no restrictions, always match
         if not self.languages and not self.file_patterns:
             return True
         
         # Check language match
-        if self.languages and language:
-            if language.lower() in [lang.lower() for lang in self.languages]:
+        if self._language_set and language:
+            if language in self._language_set:
                 return True
         
         # Check file pattern match
-        if self.file_patterns and file_path:
-            import fnmatch
-            for pattern in self.file_patterns:
-                if fnmatch.fnmatch(file_path.name, pattern):
+        if self._compiled_patterns and file_name:
+            for pattern in self._compiled_patterns:
+                if pattern.match(file_name):
                     return True
         
         # If we have restrictions but nothing matched
-        if self.languages or self.file_patterns:
-            return False
-        
-        return True
+        return False
 
 
 @dataclass
@@ -74,6 +95,8 @@ class Trigger:
     command_name: Optional[str] = None   # Display name for menu (command type)
     shortcut: Optional[str] = None       # Keyboard shortcut
     context: TriggerContext = field(default_factory=TriggerContext)
+    # The Action that action_id names, resolved by the owning Plugin
+    action: Optional['Action'] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Trigger':
@@ -93,17 +116,29 @@ class Action:
     id: str                          # Unique ID within plugin
     type: ActionType                 # Type of action
     config: Dict[str, Any] = field(default_factory=dict)  # Action-specific config
+    # A chain's sub-actions, built at load time; None if any step's config is
+    # invalid, in which case the executor builds (and reports) them as it runs
+    chain_steps: Optional[List['Action']] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_dict(cls, action_id: str, data: Dict) -> 'Action':
         action_type = ActionType(data['type'])
         # Store all other keys as config
         config = {k: v for k, v in data.items() if k != 'type'}
-        return cls(
+        action = cls(
             id=action_id,
             type=action_type,
             config=config
         )
+        if action_type == ActionType.CHAIN:
+            try:
+                action.chain_steps = [
+                    cls.from_dict(f"{action_id}_chain_{i}", step)
+                    for i, step in enumerate(config.get('actions', []))
+                ]
+            except (KeyError, ValueError, TypeError, AttributeError):
+                pass
+        return action
 
 
 @dataclass
@@ -118,6 +153,26 @@ class Plugin:
     actions: Dict[str, Action] = field(default_factory=dict)
     enabled: bool = True
     error: Optional[str] = None          # Error message if loading failed
+    # Triggers split by type once, so event dispatch doesn't filter per call
+    _command_triggers: List[Trigger] = field(init=False, repr=False, compare=False)
+    _on_save_triggers: List[Trigger] = field(init=False, repr=False, compare=False)
+    _on_open_triggers: List[Trigger] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._command_triggers = []
+        self._on_save_triggers = []
+        self._on_open_triggers = []
+        for trigger in self.triggers:
+            trigger.action = self.actions.get(trigger.action_id)
+            if trigger.type in (TriggerType.COMMAND, TriggerType.SHORTCUT):
+                self._command_triggers.append(trigger)
+            # Event triggers without an action could never run; leave them out
+            elif trigger.action is None:
+                continue
+            elif trigger.type == TriggerType.ON_SAVE:
+                self._on_save_triggers.append(trigger)
+            elif trigger.type == TriggerType.ON_OPEN:
+                self._on_open_triggers.append(trigger)
     
     @classmethod
     def from_dict(cls, data: Dict, plugin_path: Path) -> 'Plugin':
@@ -144,14 +199,12 @@ class Plugin:
     
     def get_command_triggers(self) -> List[Trigger]:
         """Get all triggers that should appear as menu commands."""
-        return [t for t in self.triggers 
-                if t.type in (TriggerType.COMMAND, TriggerType.SHORTCUT)]
+        return self._command_triggers
     
     def get_on_save_triggers(self) -> List[Trigger]:
-        """Get all on_save triggers."""
-        return [t for t in self.triggers if t.type == TriggerType.ON_SAVE]
+        """Get all on_save triggers that have an action."""
+        return self._on_save_triggers
     
     def get_on_open_triggers(self) -> List[Trigger]:
-        """Get all on_open triggers."""
-        return [t for t in self.triggers if t.type == TriggerType.ON_OPEN]
-
+        """Get all on_open triggers that have an action."""
+        return self._on_open_triggers
@@ -5,6 +5,23 @@ from typing import Dict, Any, Optional, Callable
 from pathlib import Path
 
 
+# Stand-ins for callbacks that weren't given, so the methods needn't check
+def _no_text() -> str:
+    return ""
+
+
+def _ignore(*args) -> None:
+    pass
+
+
+def _no_cursor() -> tuple:
+    return (0, 0)
+
+
+def _no_path() -> Optional[Path]:
+    return None
+
+
 class EditorAPI:
     """
     API object passed to scripts for editor interaction.
@@ -13,6 +30,14 @@ class EditorAPI:
     for Lua and Python scripts to interact with the editor.
     """
 
+    # No per-instance __dict__; scripts also can't attach attributes to it
+    __slots__ = (
+        'get_text', 'get_selection', 'get_language',
+        '_set_text', '_replace_selection', '_insert_text',
+        '_get_cursor_position', '_set_cursor_position', '_get_file_path',
+        '_show_notification',
+    )
+
     def __init__(self,
                  get_text: Callable[[], str] = None,
                  set_text: Callable[[str], None] = None,
@@ -39,43 +64,34 @@ class EditorAPI:
             get_language: Callback to get current language
             show_notification: Callback to show notification (title, message)
         """
-        self._get_text = get_text
-        self._set_text = set_text
-        self._get_selection = get_selection
-        self._replace_selection = replace_selection
-        self._insert_text = insert_text
-        self._get_cursor_position = get_cursor_position
-        self._set_cursor_position = set_cursor_position
-        self._get_file_path = get_file_path
-        self._get_language = get_language
-        self._show_notification = show_notification
-
-    def get_text(self) -> str:
-        """Get the full editor text."""
-        if self._get_text:
-            return self._get_text()
-        return ""
+        # Plain getters are bound straight through: scripts call the callback
+        # itself, with no wrapper frame
+        self.get_text = get_text or _no_text
+        self.get_selection = get_selection or _no_text
+        self.get_language = get_language or _no_text
+        self._set_text = set_text or _ignore
+        self._replace_selection = replace_selection or _ignore
+        self._insert_text = insert_text or _ignore
+        self._get_cursor_position = get_cursor_position or _no_cursor
+        self._set_cursor_position = set_cursor_position or _ignore
+        self._get_file_path = get_file_path or _no_path
+        self._show_notification = show_notification or _ignore
+
+    # get_text() -> str: the full editor text
+    # get_selection() -> str: the currently selected text
+    # get_language() -> str: the current file's language
 
     def set_text(self, text: str) -> None:
         """Replace the full editor text."""
-        if self._set_text:
-            self._set_text(str(text))
-
-    def get_selection(self) -> str:
-        """Get the currently selected text."""
-        if self._get_selection:
-            return self._get_selection()
-        return ""
+        self._set_text(str(text))
 
     def replace_selection(self, text: str) -> None:
         """Replace the current selection with new text."""
-        if self._replace_selection:
-            self._replace_selection(str(text))
+        self._replace_selection(str(text))
 
     def insert_text(self, text: str) -> None:
         """Insert text at the current cursor position."""
-        if self._insert_text:
-            self._insert_text(str(text))
+        self._insert_text(str(text))
 
     def get_cursor_position(self) -> Dict[str, int]:
         """
@@ -84,10 +100,13 @@ class EditorAPI:
         Returns:
             Dictionary with 'line' and 'column' keys (1-based)
         """
-        if self._get_cursor_position:
-            line, col = self._get_cursor_position()
-            return {"line": line + 1, "column": col + 1}  # Convert to 1-based
-        return {"line": 1, "column": 1}
+        line, column = self.get_cursor_line_column()
+        return {"line": line, "column": column}
+
+    def get_cursor_line_column(self) -> tuple:
+        """Get the cursor position as a 1-based (line, column) tuple."""
+        line, col = self._get_cursor_position()
+        return line + 1, col + 1  # Convert to 1-based
 
     def set_cursor_position(self, line: int, column: int) -> None:
         """
@@ -97,22 +116,32 @@ class EditorAPI:
             line: Line number (1-based)
             column: Column number (1-based)
         """
-        if self._set_cursor_position:
-            # Convert from 1-based to 0-based
-            self._set_cursor_position(max(0, line - 1), max(0, column - 1))
+        # Convert from 1-based to 0-based
+        self._set_cursor_position(max(0, line - 1), max(0, column - 1))
 
     def get_file_path(self) -> str:
         """Get the current file path, or empty string if no file."""
-        if self._get_file_path:
-            path = self._get_file_path()
-            return str(path) if path else ""
-        return ""
+        path = self._get_file_path()
+        return str(path) if path else ""
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get all of the read-only editor state in one call.
 
-    def get_language(self) -> str:
-        """Get the current file's language."""
-        if self._get_language:
-            return self._get_language()
-        return ""
+        Scripts that need several of these should prefer this: from Lua
+        it's one crossing into Python instead of one per getter.
+
+        Returns:
+            Dictionary with 'text', 'selection', 'cursor' (as returned by
+            get_cursor_position), 'language' and 'file_path' keys
+        """
+        return {
+            "text": self.get_text(),
+            "selection": self.get_selection(),
+            "cursor": self.get_cursor_position(),
+            "language": self.get_language(),
+            "file_path": self.get_file_path(),
+        }
 
     def show_notification(self, message: str, title: str = "Plugin") -> None:
         """
@@ -122,6 +151,4 @@ class EditorAPI:
             message: The notification message
             title: The notification title (default: "Plugin")
         """
-        if self._show_notification:
-            self._show_notification(str(title), str(message))
-
+        self._show_notification(str(title), str(message))
@@ -1,16 +1,26 @@
 # Only Code Editor - Lua Scripting Engine
 # Lua script execution and sandboxing
 
-from typing import Optional, Any
+import importlib.util
+from typing import TYPE_CHECKING, Optional, Any, Dict
 from pathlib import Path
 
-try:
+if TYPE_CHECKING:
     from lupa import LuaRuntime
-    LUPA_AVAILABLE = True
-except ImportError:
-    LUPA_AVAILABLE = False
+
+# Found without importing lupa: it (and the Lua library it links) is only
+# loaded when the first LuaEngine is created
+LUPA_AVAILABLE = importlib.util.find_spec('lupa') is not None
 
 from .editor_api import EditorAPI
+from .script_file import read_script
+
+
+def _deny_private_attributes(obj: Any, attr_name: str, is_setting: bool) -> str:
+    """lupa attribute filter: Lua code may only use public attributes."""
+    if attr_name.startswith('_'):
+        raise AttributeError(f"access to '{attr_name}' is not allowed")
+    return attr_name
 
 
 class LuaEngine:
@@ -19,6 +29,11 @@ class LuaEngine:
 
     Provides a secure environment for running Lua scripts with
     access to the editor API but no file system or network access.
+
+    Runtimes are pooled per engine (so per plugin) and reset after each
+    run: globals, the standard library and editor tables and the string
+    metatable are restored. State held inside the Lua library itself, such
+    as math.random's generator, is not reset.
     """
 
     # Safe Lua builtins to expose
@@ -31,6 +46,56 @@ class LuaEngine:
     # Safe modules/tables to expose
     SAFE_MODULES = ['string', 'table', 'math']
 
+    # Globals removed from every runtime (none are in the safe lists above)
+    DANGEROUS_GLOBALS = [
+        'io', 'os', 'loadfile', 'dofile', 'load', 'loadstring',
+        'require', 'package', 'debug', 'rawget', 'rawset',
+        'rawequal', 'setfenv', 'getfenv', 'newproxy',
+        'collectgarbage', 'gcinfo', 'module', 'python',
+    ]
+
+    # Clears them all in one chunk instead of one lupa call per name
+    CLEAR_DANGEROUS_LUA = " ".join(f"{name} = nil" for name in DANGEROUS_GLOBALS)
+
+    # Run in a new runtime once sandboxed; returns a function that puts back
+    # the globals and the fields of every table reachable from them (string,
+    # table, math, editor, ...) and of the string metatable, as they were
+    # then. Metatables set on those tables since are removed first; a
+    # protected one makes the reset fail, and the runtime is then dropped.
+    RESET_GLOBALS_LUA = """
+        local pairs, type = pairs, type
+        local getmetatable, setmetatable = getmetatable, setmetatable
+        local G = _G
+        local tables = {G}
+        for _, v in pairs(G) do
+            if type(v) == 'table' and v ~= G then tables[#tables + 1] = v end
+        end
+        tables[#tables + 1] = getmetatable('')
+        local saved = {}
+        for i = 1, #tables do
+            local fields = {}
+            for k, v in pairs(tables[i]) do fields[k] = v end
+            saved[i] = fields
+        end
+        return function()
+            for i = 1, #tables do setmetatable(tables[i], nil) end
+            for i = 1, #tables do
+                local t, fields = tables[i], saved[i]
+                for k in pairs(t) do
+                    if fields[k] == nil then t[k] = nil end
+                end
+                for k, v in pairs(fields) do t[k] = v end
+            end
+        end
+    """
+
+    # Compiled bytecode by source, shared by every engine and runtime
+    BYTECODE_CACHE_SIZE = 64
+    _bytecode_cache: Dict[str, bytes] = {}
+    # Unsandboxed runtime that only ever compiles (never runs) scripts; no
+    # encoding, so string.dump's binary output comes back as bytes
+    _compiler: Optional[Any] = None
+
     def __init__(self, editor_api: EditorAPI):
         """
         Initialize the Lua engine.
@@ -38,84 +103,71 @@ class LuaEngine:
         Args:
             editor_api: EditorAPI instance for editor interaction
         """
-        if not LUPA_AVAILABLE:
-            raise ImportError("lupa library not available. Install with: pip install lupa")
+        try:
+            from lupa import LuaRuntime
+        except ImportError:
+            raise ImportError("lupa library not available. Install with: pip install lupa") from None
 
+        self._runtime_class = LuaRuntime
         self.editor_api = editor_api
-        self._lua: Optional[LuaRuntime] = None
+        self._lua: Optional['LuaRuntime'] = None
         self._last_error: Optional[str] = None
+        # Idle sandboxed runtimes, each with its globals-reset function
+        self._runtime_pool: list = []
 
-    def _create_runtime(self) -> LuaRuntime:
+    def _create_runtime(self) -> 'LuaRuntime':
         """Create a new sandboxed Lua runtime."""
-        # Create Lua runtime with restricted globals
-        lua = LuaRuntime(unpack_returned_tuples=True)
-
-        # Get access to globals
-        g = lua.globals()
-
-        # Store original modules we want to keep
-        safe_globals = {}
-        for name in self.SAFE_BUILTINS:
-            if g[name] is not None:
-                safe_globals[name] = g[name]
-
-        for name in self.SAFE_MODULES:
-            if g[name] is not None:
-                safe_globals[name] = g[name]
+        # Create Lua runtime with restricted globals. lupa's python.eval and
+        # python.builtins are never registered, and Python objects handed to
+        # Lua don't expose private attributes (e.g. a callback's __globals__)
+        lua = self._runtime_class(
+            unpack_returned_tuples=True,
+            register_eval=False,
+            register_builtins=False,
+            attribute_filter=_deny_private_attributes,
+        )
 
         # Clear dangerous globals
-        dangerous = ['io', 'os', 'loadfile', 'dofile', 'load', 'loadstring',
-                     'require', 'package', 'debug', 'rawget', 'rawset',
-                     'rawequal', 'setfenv', 'getfenv', 'newproxy',
-                     'collectgarbage', 'gcinfo', 'module']
-
-        for name in dangerous:
-            g[name] = None
-
-        # Re-add safe globals (in case we cleared something we wanted)
-        for name, value in safe_globals.items():
-            g[name] = value
+        lua.execute(self.CLEAR_DANGEROUS_LUA)
 
         # Add editor API
         self._expose_editor_api(lua)
 
         return lua
 
-    def _expose_editor_api(self, lua: LuaRuntime) -> None:
+    def _expose_editor_api(self, lua: 'LuaRuntime') -> None:
         """Expose the editor API to Lua as a global 'editor' table."""
-        g = lua.globals()
-
-        # Create editor table using Lua
-        lua.execute("""
-            editor = {}
-        """)
-
-        editor_table = g.editor
-
-        # Expose API methods
-        editor_table.get_text = self.editor_api.get_text
-        editor_table.set_text = self.editor_api.set_text
-        editor_table.get_selection = self.editor_api.get_selection
-        editor_table.replace_selection = self.editor_api.replace_selection
-        editor_table.insert_text = self.editor_api.insert_text
-        editor_table.get_file_path = self.editor_api.get_file_path
-        editor_table.get_language = self.editor_api.get_language
-        editor_table.show_notification = self.editor_api.show_notification
+        api = self.editor_api
 
         # Cursor position needs special handling (returns table)
         def get_cursor_pos():
-            pos = self.editor_api.get_cursor_position()
-            # Return as a Lua table
-            result = lua.table()
-            result.line = pos['line']
-            result.column = pos['column']
-            return result
+            # Return as a Lua table (filled from the tuple; no dict in between)
+            line, column = api.get_cursor_line_column()
+            return lua.table(line=line, column=column)
 
         def set_cursor_pos(line, column):
-            self.editor_api.set_cursor_position(int(line), int(column))
-
-        editor_table.get_cursor_position = get_cursor_pos
-        editor_table.set_cursor_position = set_cursor_pos
+            api.set_cursor_position(int(line), int(column))
+
+        def get_state():
+            state = api.get_state()
+            state['cursor'] = lua.table_from(state['cursor'])
+            return lua.table_from(state)
+
+        # Build the table in one call rather than parsing "editor = {}" and
+        # then setting each field through lupa
+        lua.globals().editor = lua.table_from({
+            'get_text': api.get_text,
+            'set_text': api.set_text,
+            'get_selection': api.get_selection,
+            'replace_selection': api.replace_selection,
+            'insert_text': api.insert_text,
+            'get_file_path': api.get_file_path,
+            'get_language': api.get_language,
+            'show_notification': api.show_notification,
+            'get_cursor_position': get_cursor_pos,
+            'set_cursor_position': set_cursor_pos,
+            'get_state': get_state,
+        })
 
     def execute_file(self, file_path: Path, entry_point: str = None) -> bool:
         """
@@ -129,16 +181,14 @@ class LuaEngine:
             True if successful, False otherwise
         """
         try:
-            if not file_path.exists():
-                self._last_error = f"Script file not found: {file_path}"
-                return False
-
-            code = file_path.read_text(encoding='utf-8')
-            return self.execute_string(code, entry_point)
-
+            code = read_script(file_path)
+        except FileNotFoundError:
+            self._last_error = f"Script file not found: {file_path}"
+            return False
         except Exception as e:
             self._last_error = f"Failed to read script: {e}"
             return False
+        return self.execute_string(code, entry_point)
 
     def execute_string(self, code: str, entry_point: str = None) -> bool:
         """
@@ -151,12 +201,19 @@ class LuaEngine:
         Returns:
             True if successful, False otherwise
         """
+        # Reuse a sandboxed runtime with its globals reset after each run.
+        # Engines are per plugin, so no runtime is shared between plugins.
+        lua, reset_globals = self._checkout()
         try:
-            # Create fresh runtime for each execution (security)
-            self._lua = self._create_runtime()
+            self._lua = lua
 
-            # Execute the code
-            self._lua.execute(code)
+            # Execute the code, from cached bytecode when it compiles
+            bytecode = self._get_bytecode(code)
+            if bytecode is None:
+                # Syntax error: run the source for lupa's usual error message
+                self._lua.execute(code)
+            else:
+                self._lua.compile(bytecode)()
 
             # Call entry point if specified
             if entry_point:
@@ -173,6 +230,46 @@ class LuaEngine:
         except Exception as e:
             self._last_error = str(e)
             return False
+        finally:
+            self._checkin(lua, reset_globals)
+
+    def _checkout(self) -> tuple:
+        """Take an idle runtime from the pool, or create one."""
+        if self._runtime_pool:
+            return self._runtime_pool.pop()
+        lua = self._create_runtime()
+        return lua, lua.execute(self.RESET_GLOBALS_LUA)
+
+    def _checkin(self, lua: 'LuaRuntime', reset_globals: Any) -> None:
+        """Reset a runtime's globals and return it to the pool."""
+        try:
+            reset_globals()
+        except Exception:
+            return  # Can't be trusted clean; let it be garbage collected
+        self._runtime_pool.append((lua, reset_globals))
+
+    @classmethod
+    def _get_bytecode(cls, code: str) -> Optional[bytes]:
+        """Get the bytecode for a script, compiling it on first use.
+
+        Returns None if the source doesn't compile.
+        """
+        bytecode = cls._bytecode_cache.get(code)
+        if bytecode is None:
+            if cls._compiler is None:
+                from lupa import LuaRuntime  # Already loaded by __init__
+                cls._compiler = LuaRuntime(encoding=None)
+            load = cls._compiler.eval('load')
+            # Same chunk name as LuaRuntime.execute(), for identical tracebacks
+            result = load(code.encode('utf-8'), b'<python>')
+            if isinstance(result, tuple):  # (nil, message)
+                return None
+            bytecode = cls._compiler.eval('string.dump')(result)
+            if len(cls._bytecode_cache) >= cls.BYTECODE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cls._bytecode_cache[next(iter(cls._bytecode_cache))]
+            cls._bytecode_cache[code] = bytecode
+        return bytecode
 
     def get_last_error(self) -> Optional[str]:
         """Get the last error message, if any."""
@@ -1,10 +1,20 @@
 # Only Code Editor - Python Scripting Engine
 # Python script execution with restricted environment
 
+import functools
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 from .editor_api import EditorAPI
+from .script_file import read_script
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_script(code: str, filename: str):
+    """Compile script source, reusing the code object for a repeat of it."""
+    # Code objects are immutable, so one can be exec'd in any number of
+    # fresh globals; the lru_cache key is the source text itself
+    return compile(code, filename, 'exec')
 
 
 class PythonEngine:
@@ -87,19 +97,20 @@ class PythonEngine:
         """
         self.editor_api = editor_api
         self._last_error: Optional[str] = None
-
-    def _create_restricted_globals(self) -> Dict[str, Any]:
-        """Create a restricted globals dictionary for script execution."""
-        # Start with safe builtins
-        restricted = {
-            '__builtins__': self.SAFE_BUILTINS.copy(),
+        # Copied for each run; __builtins__ is filled in per run
+        self._globals_template: Dict[str, Any] = {
+            '__builtins__': None,
             '__name__': '__main__',
             '__doc__': None,
+            'editor': editor_api,
         }
-        
-        # Add editor API
-        restricted['editor'] = self.editor_api
-        
+
+    def _create_restricted_globals(self) -> Dict[str, Any]:
+        """Create a restricted globals dictionary for script execution."""
+        restricted = self._globals_template.copy()
+        # Each run gets its own copy of the safe builtins, so a script that
+        # changes them can't affect the next one
+        restricted['__builtins__'] = self.SAFE_BUILTINS.copy()
         return restricted
 
     def execute_file(self, file_path: Path, entry_point: str = None) -> bool:
@@ -114,16 +125,14 @@ class PythonEngine:
             True if successful, False otherwise
         """
         try:
-            if not file_path.exists():
-                self._last_error = f"Script file not found: {file_path}"
-                return False
-            
-            code = file_path.read_text(encoding='utf-8')
-            return self.execute_string(code, entry_point, str(file_path))
-            
+            code = read_script(file_path)
+        except FileNotFoundError:
+            self._last_error = f"Script file not found: {file_path}"
+            return False
         except Exception as e:
             self._last_error = f"Failed to read script: {e}"
             return False
+        return self.execute_string(code, entry_point, str(file_path))
 
     def execute_string(self, code: str, entry_point: str = None, 
                        filename: str = "<script>") -> bool:
@@ -142,8 +151,8 @@ class PythonEngine:
             # Create fresh restricted environment
             restricted_globals = self._create_restricted_globals()
             
-            # Compile and execute
-            compiled = compile(code, filename, 'exec')
+            # Compile (once per distinct source) and execute
+            compiled = _compile_script(code, filename)
             exec(compiled, restricted_globals)
             
             # Call entry point if specified
@@ -0,0 +1,25 @@
+# Only Code Editor - Script File Reading
+# Shared by the Python and Lua engines
+
+import os
+
+# Scripts are small; one read of this size normally gets the whole file
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def read_script(path: os.PathLike | str) -> str:
+    """Read a script file as UTF-8 text. Raises FileNotFoundError if missing."""
+    # A raw fd and os.read skip the buffered text layer (and the separate
+    # exists() stat) that Path.read_text goes through on every run
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    # Both compilers accept CRLF, so no newline translation is needed
+    return b''.join(chunks).decode('utf-8')
@@ -18,13 +18,8 @@ else:
     # Running as script
     application_path = os.path.dirname(os.path.abspath(__file__))
 
-# Import and run the application
-from onlycode.app.application import OnlyCodeApp
-
-
-def main():
-    app = OnlyCodeApp()
-    app.run()
+# Import and run the application (shares the entry point with `python -m onlycode.main`)
+from onlycode.main import main
 
 
 if __name__ == "__main__":